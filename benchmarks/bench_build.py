@@ -0,0 +1,61 @@
+"""Full versus incremental ``SpecificationBuilder.build``, serialized and encoded with ``cache=True``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_build [operations]
+"""
+import sys
+import time
+
+from openapitools import ComponentsBuilder, OperationBuilder, SpecificationBuilder
+
+
+class Todo:
+    id: int
+    text: str
+    done: bool
+
+
+def operation(i: int) -> OperationBuilder:
+    op = OperationBuilder()
+    op.parameter('id', int, 'path')
+    op.describe('Operation %d' % i)
+    op.tag('todo')
+    op.response(200, Todo)
+
+    return op
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+
+    return time.perf_counter() - start
+
+
+def main(number: int = 8000):
+    builder = SpecificationBuilder(ComponentsBuilder())
+    builder.describe('Benchmark', '1.0')
+    builder.license('MIT')
+    builder.contact('John Doe')
+
+    for i in range(number):
+        builder.operation('/todo/%d/{id}' % i, 'GET', operation(i))
+
+    methods = {
+        'serialize': lambda spec: spec.serialize(),
+        'encode': lambda spec: spec.encode(cache=True),
+    }
+
+    for method, func in methods.items():
+        full = measure(lambda: func(builder.build()))
+
+        builder.operation('/todo/0/{id}', 'GET', operation(number))
+
+        incremental = measure(lambda: func(builder.build()))
+
+        print('%d operations, %s: full %.3fs, after one change %.3fs' % (number, method, full, incremental))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Generated response encoders versus ``json.dumps`` with a reflective ``default`` hook.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_encoders [objects]
+"""
+import base64
+import json
+import sys
+import time
+
+from datetime import date, datetime
+from typing import List
+
+from openapitools.encoders import dumps
+
+
+class Tag:
+    name: str
+    color: str
+
+    def __init__(self, name: str):
+        self.name = name
+        self.color = 'red'
+
+
+class Todo:
+    id: int
+    text: str
+    done: bool
+    due: date
+    created: datetime
+    checksum: bytes
+    tags: List[Tag]
+
+    def __init__(self, i: int):
+        self.id = i
+        self.text = 'Buy milk %d' % i
+        self.done = bool(i % 2)
+        self.due = date(2020, 1, 1 + i % 28)
+        self.created = datetime(2020, 1, 1, i % 24, i % 60)
+        self.checksum = b'\x00\x01\x02\x03'
+        self.tags = [Tag('home'), Tag('shop')]
+
+
+def default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode('ascii')
+
+    return {k: v for k, v in vars(value).items() if not k.startswith('_')}
+
+
+def measure(func, number: int = 20) -> float:
+    start = time.perf_counter()
+
+    for _ in range(number):
+        func()
+
+    return (time.perf_counter() - start) / number
+
+
+def main(number: int = 10000):
+    todos = [Todo(i) for i in range(number)]
+
+    assert json.loads(dumps(todos, List[Todo])) == json.loads(json.dumps(todos, default=default))
+
+    generated = measure(lambda: dumps(todos, List[Todo]))
+    reflective = measure(lambda: json.dumps(todos, default=default))
+
+    print('%d objects: generated %.1fms, json.dumps with default %.1fms' % (number, generated * 1e3, reflective * 1e3))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
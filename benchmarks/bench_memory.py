@@ -0,0 +1,38 @@
+"""Memory footprint of ``Definition`` nodes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+from openapitools.definitions import Parameter
+from openapitools.types import Integer, Object, String
+
+
+def measure(factory, number: int = 10000) -> float:
+    tracemalloc.start()
+
+    nodes = [factory() for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del nodes
+
+    return size / number
+
+
+def main():
+    cases = [
+        ('Integer()', lambda: Integer()),
+        ('String(maxLength=10)', lambda: String(maxLength=10)),
+        ('Parameter', lambda: Parameter('id', None, 'path', required=True)),
+        ('Object (3 properties)', lambda: Object({'id': Integer(), 'text': String(), 'done': Integer()})),
+    ]
+
+    for name, factory in cases:
+        print('%-24s %6.0f bytes per node' % (name, measure(factory)))
+
+
+if __name__ == '__main__':
+    main()
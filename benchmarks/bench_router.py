@@ -0,0 +1,84 @@
+"""``Router.match`` versus a linear scan over one regex per templated path.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_router [routes]
+"""
+import random
+import re
+import sys
+import time
+
+from openapitools import ComponentsBuilder, OperationBuilder, SpecificationBuilder
+from openapitools.router import Router
+
+
+def paths(number: int):
+    for i in range(number):
+        kind = i % 4
+
+        if kind == 0:
+            yield '/service%d/items' % i
+        elif kind == 1:
+            yield '/service%d/items/{id}' % i
+        elif kind == 2:
+            yield '/service%d/items/{id}/tags/{tag}' % i
+        else:
+            yield '/service%d/files/{name}.{ext}' % i
+
+
+def request(path: str) -> str:
+    return re.sub(r'{([^{}]+)}', lambda m: 'x%d' % len(m.group(1)), path)
+
+
+def measure(func, requests) -> float:
+    start = time.perf_counter()
+
+    for method, path in requests:
+        func(method, path)
+
+    return (time.perf_counter() - start) / len(requests)
+
+
+def main(number: int = 10000, lookups: int = 2000):
+    builder = SpecificationBuilder(ComponentsBuilder())
+    builder.describe('Benchmark', '1.0')
+    builder.license('MIT')
+    builder.contact('John Doe')
+
+    for path in paths(number):
+        builder.operation(path, 'GET', OperationBuilder())
+
+    spec = builder.build()
+
+    start = time.perf_counter()
+    router = Router(spec)
+    compiled = time.perf_counter() - start
+
+    patterns = [
+        (re.compile('^%s$' % re.sub(r'\\{([^{}]+)\\}', r'(?P<\1>[^/]+)', re.escape(path))), item)
+        for path, item in spec.paths.items()
+    ]
+
+    def scan(method, path):
+        for pattern, item in patterns:
+            match = pattern.match(path)
+
+            if match is not None:
+                return getattr(item, method.lower(), None), match.groupdict()
+
+    requests = [('GET', request(x)) for x in random.Random(0).sample(list(spec.paths), lookups)]
+
+    for method, path in requests[:100]:
+        assert router.match(method, path)[0] is scan(method, path)[0]
+
+    trie = measure(router.match, requests)
+    linear = measure(scan, requests[:max(1, lookups // 20)])
+
+    print('%d routes: compiled in %.3fs, match %.2fus, linear regex scan %.2fus' % (
+        number, compiled, trie * 1e6, linear * 1e6
+    ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
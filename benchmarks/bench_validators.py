@@ -0,0 +1,114 @@
+"""Compiled validators versus interpreting the serialized schema dict on every call.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_validators [payloads]
+"""
+import re
+import sys
+import time
+
+from typing import List
+
+from openapitools import ComponentsBuilder
+from openapitools.types import Integer, String, Reference
+from openapitools.validators import Compiler
+
+_types = {
+    'integer': int,
+    'number': (int, float),
+    'string': str,
+    'boolean': bool,
+    'array': list,
+    'object': dict,
+}
+
+
+class Tag:
+    name: str
+    weight: float
+
+
+class Todo:
+    id: int
+    text: str
+    done: bool
+    tags: List[Tag]
+    children: List['Todo']
+
+
+def interpret(schema: dict, value, components: dict):
+    if '$ref' in schema:
+        return interpret(components[schema['$ref'].rsplit('/', 1)[1]], value, components)
+
+    _type = schema.get('type')
+
+    if _type is not None:
+        if not isinstance(value, _types[_type]) or (_type != 'boolean' and isinstance(value, bool)):
+            raise ValueError('%s expected' % _type)
+
+    if 'minimum' in schema and value < schema['minimum']:
+        raise ValueError('too small')
+
+    if 'maximum' in schema and value > schema['maximum']:
+        raise ValueError('too large')
+
+    if 'maxLength' in schema and len(value) > schema['maxLength']:
+        raise ValueError('too long')
+
+    if 'pattern' in schema and re.search(schema['pattern'], value) is None:
+        raise ValueError('no match')
+
+    if 'items' in schema:
+        for x in value:
+            interpret(schema['items'], x, components)
+
+    for k, v in schema.get('properties', {}).items():
+        if k in value:
+            interpret(v, value[k], components)
+        elif v.get('required'):
+            raise ValueError('%s is required' % k)
+
+
+def payload(depth: int) -> dict:
+    return {
+        'id': depth,
+        'text': 'Buy milk %d' % depth,
+        'done': False,
+        'tags': [{'name': 'home', 'weight': 0.5}, {'name': 'shop', 'weight': 1.0}],
+        'children': [payload(depth - 1)] if depth else [],
+    }
+
+
+def measure(func, number: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(number):
+        func()
+
+    return (time.perf_counter() - start) / number
+
+
+def main(number: int = 20000):
+    components = ComponentsBuilder()
+    components.scheme('Todo', Todo)
+    components.scheme('Id', Integer(minimum=0, maximum=2 ** 31))
+    components.scheme('Slug', String(pattern='^[a-z0-9-]+$', maxLength=64))
+
+    spec = components.build()
+    serialized = spec.serialize()['schemas']
+    compiler = Compiler(spec)
+
+    for name, value in (('Todo', payload(3)), ('Id', 42), ('Slug', 'buy-milk')):
+        schema = Reference('#/components/schemas/%s' % name)
+        validate = compiler.compile(schema)
+        data = schema.serialize()
+
+        compiled = measure(lambda: validate(value), number)
+        interpreted = measure(lambda: interpret(data, value, serialized), number)
+
+        print('%s: compiled %.2fus, interpreted %.2fus' % (name, compiled * 1e6, interpreted * 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
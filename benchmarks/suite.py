@@ -0,0 +1,227 @@
+"""Benchmark suite for schema generation, registration, building and serialization.
+
+Every case runs on synthetic models and routes, so the suite needs nothing but the
+library. Each case reports its best time over ``--repeat`` runs and the peak memory
+allocated by one more run. Short cases are repeated until their timed runs add up to
+``--min-time`` seconds, cases faster than ``--floor`` seconds are reported but never
+fail a comparison, and a case found slower is measured once more. Results can be saved
+and later compared against::
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json
+
+Run from the repository root. ``--filter`` selects cases by substring and
+``--sizes`` sets the operation counts of the build cases.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List
+
+from openapitools import ComponentsBuilder, OperationBuilder, Schema, SpecificationBuilder
+
+_scalars = (int, str, float, bool)
+
+
+def wide_model(width: int, name: str = 'Wide') -> type:
+    return type(name, (), {'__annotations__': {'field%d' % i: _scalars[i % 4] for i in range(width)}})
+
+
+def deep_model(depth: int, name: str = 'Deep') -> type:
+    model = type('%s%d' % (name, depth), (), {'__annotations__': {'id': int, 'text': str}})
+
+    for i in range(depth - 1, 0, -1):
+        model = type('%s%d' % (name, i), (), {'__annotations__': {'id': int, 'child': model, 'children': List[model]}})
+
+    return model
+
+
+def models(number: int) -> List[type]:
+    return [
+        type('Model%d' % i, (), {'__annotations__': {'id': int, 'text': str, 'score': float, 'done': bool}})
+        for i in range(number)
+    ]
+
+
+def operation(i: int, model: type) -> OperationBuilder:
+    op = OperationBuilder()
+    op.describe('Operation %d' % i)
+    op.tag('tag%d' % (i % 10))
+    op.parameter('id', int, 'path')
+    op.parameter('limit', int)
+    op.response(200, model)
+
+    return op
+
+
+def specification(number: int) -> SpecificationBuilder:
+    components = ComponentsBuilder()
+    types = models(max(1, number // 10))
+
+    for model in types:
+        components.scheme(model.__name__, model)
+
+    builder = SpecificationBuilder(components)
+    builder.describe('Benchmark', '1.0')
+    builder.license('MIT')
+    builder.contact('John Doe')
+
+    for i in range(number):
+        builder.operation('/resource%d/{id}' % i, ('GET', 'POST', 'PUT')[i % 3], operation(i, types[i % len(types)]))
+
+    return builder
+
+
+def cases(sizes: List[int]) -> Dict[str, Callable[[], Callable[[], Any]]]:
+    # each entry prepares untimed state and returns the function to measure
+    result = {}
+
+    def make_wide():
+        model = wide_model(500)
+        ComponentsBuilder()
+
+        return lambda: Schema.make(model)
+
+    def make_deep():
+        model = deep_model(60)
+        ComponentsBuilder()
+
+        return lambda: Schema.make(model)
+
+    def register_components():
+        types = models(1000)
+        components = ComponentsBuilder()
+
+        def register():
+            for model in types:
+                components.scheme(model.__name__, model)
+
+            return components.build()
+
+        return register
+
+    def register_operations():
+        types = models(10)
+        ComponentsBuilder()
+
+        return lambda: [operation(i, types[i % 10]).build() for i in range(1000)]
+
+    result['schema.make wide 500'] = make_wide
+    result['schema.make deep 60'] = make_deep
+    result['components.scheme 1000'] = register_components
+    result['operations 1000'] = register_operations
+
+    for size in sizes:
+        result['build %d' % size] = lambda size=size: specification(size).build
+        result['serialize %d' % size] = lambda size=size: specification(size).build().serialize
+        result['str %d' % size] = lambda size=size: specification(size).build().__str__
+
+    return result
+
+
+def measure(setup: Callable[[], Callable[[], Any]], repeat: int, min_time: float = 0.0) -> Dict[str, float]:
+    # short cases run until their timed runs add up to min_time, so their best time is stable
+    best = float('inf')
+    runs = 0
+    total = 0.0
+
+    while runs < repeat or total < min_time and runs < 1000:
+        func = setup()
+        gc.collect()
+
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+
+    func = setup()
+    gc.collect()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'time': best, 'peak': peak}
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float,
+           floor: float = 0.0) -> int:
+    regressions = 0
+
+    print('%-24s %10s %10s %10s %10s' % ('case', 'time', 'vs base', 'peak', 'vs base'))
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        line = '%-24s %9.2fms %10s %8.0fKB %10s' % (
+            name, result['time'] * 1e3, _ratio(result, base, 'time'),
+            result['peak'] / 1024, _ratio(result, base, 'peak')
+        )
+
+        if _slower(result, base, tolerance, floor):
+            regressions += 1
+            line += '  slower'
+
+        print(line)
+
+    return regressions
+
+
+def _slower(result: Dict[str, float], base: Dict[str, float], tolerance: float, floor: float) -> bool:
+    # cases faster than the floor are too noisy to fail the run
+    return bool(base) and base['time'] >= floor and result['time'] > base['time'] * (1 + tolerance)
+
+
+def _ratio(result: Dict[str, float], base: Dict[str, float], key: str) -> str:
+    if not base or not base[key]:
+        return '-'
+
+    return '%.2fx' % (result[key] / base[key])
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='openapitools benchmark suite')
+    parser.add_argument('--sizes', default='100,1000,10000', help='operation counts of the build cases')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best one is reported')
+    parser.add_argument('--filter', default='', help='run only cases containing this text')
+    parser.add_argument('--save', help='write results to this file')
+    parser.add_argument('--compare', help='compare against results saved before')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='slowdown reported as a regression')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds of timed runs per case at least')
+    parser.add_argument('--floor', type=float, default=0.01, help='seconds under which a case is never a regression')
+    args = parser.parse_args(argv)
+
+    sizes = [int(x) for x in args.sizes.split(',') if x]
+    baseline = {}
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)['results']
+
+    setups = {name: setup for name, setup in cases(sizes).items() if args.filter in name}
+    results = {name: measure(setup, args.repeat, args.min_time) for name, setup in setups.items()}
+
+    # a slower case is measured once more, so a single noisy pass does not fail the comparison
+    for name, setup in setups.items():
+        if _slower(results[name], baseline.get(name), args.tolerance, args.floor):
+            results[name]['time'] = min(results[name]['time'], measure(setup, args.repeat, args.min_time)['time'])
+
+    regressions = report(results, baseline, args.tolerance, args.floor)
+
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump({'python': platform.python_version(), 'results': results}, fp, indent=2)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,3 +4,4 @@ from .types import Schema
 __all__ = ['SpecificationBuilder', 'OperationBuilder', 'ComponentsBuilder', 'Schema']
 
 name = 'openapitools'
+version = '0.0.2'
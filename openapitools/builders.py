@@ -1,6 +1,14 @@
+import importlib
+import pkgutil
+
 from collections import defaultdict
+from enum import Enum
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, Tuple
+from openapitools.deduplicate import deduplicate as dedupe
 from openapitools.definitions import *
-from openapitools.types import Reference
+from openapitools.helpers import nested, properties
+from openapitools.types import Object, Reference, Registry
 
 
 class ComponentsBuilder:
@@ -13,8 +21,10 @@ class ComponentsBuilder:
     _links: Dict[str, Link]
     _callbacks: Dict[str, Dict[str, PathItem]]
     _security: Dict[str, SecurityScheme]
+    _registry: Registry
+    _components: Components = None
 
-    def __init__(self):
+    def __init__(self, intern: bool = False):
         self._schemas = {}
         self._responses = {}
         self._parameters = {}
@@ -24,8 +34,8 @@ class ComponentsBuilder:
         self._links = {}
         self._callbacks = {}
         self._security = {}
-
-        Schema.definitions = self._schemas
+        self._registry = Registry(intern)
+        self._registry.activate()
 
     def maybe_ref(self, section: str, content: Any):
         if type(content) != type:
@@ -38,34 +48,104 @@ class ComponentsBuilder:
 
         return content
 
+    @property
+    def registry(self) -> Registry:
+        return self._registry
+
+    def scope(self):
+        return self._registry.scope()
+
     def scheme(self, name: str, value: Any, **kwargs):
-        self._schemas[name] = Schema.make(self.maybe_ref('schemas', value), **kwargs)
+        self._components = None
+
+        with self._registry.scope():
+            self._schemas[name] = self._definition(value, **kwargs)
+
+    def schemes(self, *sources: Any):
+        """Register the annotated classes of modules and packages, and the classes of iterables.
+
+        Models they refer to are registered too, dependencies first, and every nested model becomes a `$ref`.
+        """
+        self._components = None
+        graph = _dependencies(_models(sources))
+        registry = self._registry
+
+        with registry.scope(), registry.lock:
+            names = {cls.__name__: cls for cls in registry.references}
+
+            for cls in graph:
+                other = names.setdefault(cls.__name__, cls)
+
+                if other is not cls:
+                    raise ValueError('Models %s.%s and %s.%s have the same name' % (
+                        other.__module__, other.__qualname__, cls.__module__, cls.__qualname__))
+
+            for cls in graph:
+                registry.references.setdefault(cls, Reference('#/components/schemas/%s' % cls.__name__))
+
+            for cls in _topological(graph):
+                schema = registry.intern(Object(graph[cls][0]))
+                registry.definitions[cls] = schema
+                self._schemas[cls.__name__] = schema
+
+    def _definition(self, value: Any, **kwargs) -> Schema:
+        # a model registered before is stored as its definition, not as a `$ref` to itself
+        if not isinstance(value, type) or value.__name__ not in self._schemas:
+            return Schema.make(self.maybe_ref('schemas', value), **kwargs)
+
+        if value not in self._registry.references:
+            return Schema.make(value, **kwargs)
+
+        with self._registry.lock:
+            schema = self._registry.definitions[value]
+
+        return Object(getattr(schema, 'properties', None), **kwargs) if kwargs else schema
 
     def response(self, name: str, value: Any, **kwargs):
-        self._responses[name] = value if isinstance(value, Response) else \
-            Response.make(self.maybe_ref('schemas', value), **kwargs)
+        self._components = None
+
+        with self._registry.scope():
+            self._responses[name] = value if isinstance(value, Response) else \
+                Response.make(self.maybe_ref('schemas', value), **kwargs)
 
     def parameter(self, name: str, value: Any, location: str = 'query', **kwargs):
-        self._parameters[name] = value if isinstance(value, Parameter) else \
-            Parameter.make(name, self.maybe_ref('schemas', value), location, **kwargs)
+        self._components = None
+
+        with self._registry.scope():
+            self._parameters[name] = value if isinstance(value, Parameter) else \
+                Parameter.make(name, self.maybe_ref('schemas', value), location, **kwargs)
 
     def example(self, name: str, value: Any, **kwargs):
+        self._components = None
         self._examples[name] = value if isinstance(value, Example) else Example(value, **kwargs)
 
     def security(self, name: str, _type: str, cls: type, **kwargs):
+        self._components = None
         self._security[name] = SecurityScheme.make(_type, cls, **kwargs)
 
     def build(self):
+        if self._components is None or self._recursive != len(self._registry.recursive):
+            self._components = self._build()
+            self._recursive = len(self._registry.recursive)
+
+        return self._components
+
+    def _build(self):
+        schemas = dict(self._schemas)
+
+        for name, schema in self._registry.components().items():
+            schemas.setdefault(name, schema)
+
         return Components(
-            schemas=self._schemas,
-            responses=self._responses,
-            parameters=self._parameters,
-            examples=self._examples,
-            requestBodies=self._bodies,
-            headers=self._headers,
-            links=self._links,
-            callbacks=self._callbacks,
-            securitySchemes=self._security
+            schemas=schemas,
+            responses=dict(self._responses),
+            parameters=dict(self._parameters),
+            examples=dict(self._examples),
+            requestBodies=dict(self._bodies),
+            headers=dict(self._headers),
+            links=dict(self._links),
+            callbacks=dict(self._callbacks),
+            securitySchemes=dict(self._security)
         )
 
 
@@ -82,11 +162,30 @@ class OperationBuilder:
     callbacks: List[str]
     deprecated: bool = False
 
+    _operation: Operation = None
+    _containers: Dict[str, Any] = None
+    _registry: Registry = None
+    _made: List[Tuple[Any, Registry, Callable[[], Any]]]
+
     def __init__(self):
         self.tags = []
         self.security = []
         self.parameters = []
         self.responses = {}
+        self._made = []
+
+    def __setattr__(self, key, value):
+        super().__setattr__(key, value)
+
+        if not key.startswith('_'):
+            self.touch()
+
+    def touch(self):
+        self._operation = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._operation is None
 
     def name(self, value: str):
         self.operationId = value
@@ -105,20 +204,24 @@ class OperationBuilder:
         for arg in args:
             self.tags.append(arg)
 
+        self.touch()
+
     def deprecate(self):
         self.deprecated = True
 
     def body(self, content: Any, **kwargs):
-        self.requestBody = RequestBody.make(content, **kwargs)
+        self.requestBody = self._make(lambda: RequestBody.make(content, **kwargs))
 
     def parameter(self, name: str, schema: Any, location: str = 'query', **kwargs):
         if location == 'path':
             kwargs['required'] = True
 
-        self.parameters.append(Parameter.make(name, schema, location, **kwargs))
+        self.parameters.append(self._make(lambda: Parameter.make(name, schema, location, **kwargs)))
+        self.touch()
 
     def response(self, status, content: Any = None, description: str = None, **kwargs):
-        self.responses[status] = Response.make(content, description, **kwargs)
+        self.responses[status] = self._make(lambda: Response.make(content, description, **kwargs))
+        self.touch()
 
     def secured(self, *args, **kwargs):
         items = {**{v: [] for v in args}, **kwargs}
@@ -129,9 +232,65 @@ class OperationBuilder:
             gates[gate] = params
 
         self.security.append(gates)
+        self.touch()
+
+    def bind(self, registry: Registry):
+        """Make the schemas of this operation in `registry` from now on, remaking those made in another one.
+
+        Classes found recursive are recorded in the registry schemas are made in, and only the components of
+        that registry define them.
+        """
+        made, self._made = self._made, []
+        self._registry = registry
+
+        for value, used, factory in made:
+            if used is not registry:
+                self._replace(value, self._make(factory))
 
     def build(self):
-        return Operation(**self.__dict__)
+        # tags, parameters and the like may be changed in place, compared with the copies built last time
+        if self._operation is not None and any(v != self._containers.get(k) for k, v in self._lists()):
+            self._operation = None
+
+        if self._operation is None:
+            fields = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+            containers = {k: v.copy() for k, v in self._lists()}
+            fields.update(containers)
+
+            self._operation = Operation(**fields)
+            self._containers = containers
+
+        return self._operation
+
+    def _make(self, factory: Callable[[], Any]) -> Any:
+        # until bound, schemas are made in the registry of the caller's context and remade when bound if it differs
+        registry = self._registry or Registry.current()
+
+        with registry.scope():
+            value = factory()
+
+        if self._registry is None:
+            self._made.append((value, registry, factory))
+
+        return value
+
+    def _replace(self, value: Any, replacement: Any):
+        # entries replaced or removed since they were made are left alone
+        if self.__dict__.get('requestBody') is value:
+            self.requestBody = replacement
+
+        for i, item in enumerate(self.parameters):
+            if item is value:
+                self.parameters[i] = replacement
+
+        for key, item in self.responses.items():
+            if item is value:
+                self.responses[key] = replacement
+
+        self.touch()
+
+    def _lists(self) -> Iterator[Tuple[str, Any]]:
+        return ((k, v) for k, v in self.__dict__.items() if not k.startswith('_') and isinstance(v, (list, dict)))
 
 
 class SpecificationBuilder:
@@ -144,11 +303,13 @@ class SpecificationBuilder:
     _paths: Dict[str, Dict[str, OperationBuilder]]
     _tags: Dict[str, Tag]
     _components: ComponentsBuilder
+    _items: Dict[str, Tuple[Dict[str, Operation], PathItem]]
 
     def __init__(self, components: ComponentsBuilder):
         self._components = components
         self._paths = defaultdict(dict)
         self._tags = {}
+        self._items = {}
 
     def describe(self, title: str, version: str, description: str = None, terms: str = None):
         self._title = title
@@ -177,14 +338,20 @@ class SpecificationBuilder:
 
             self._tags[_tag] = Tag(_tag)
 
+        operation.bind(self._components.registry)
         self._paths[path][method] = operation
 
-    def build(self) -> OpenAPI:
+    def build(self, deduplicate: bool = False, threshold: int = 4) -> OpenAPI:
         info = self._build_info()
-        paths = self._build_paths()
         tags = self._build_tags()
+        paths = self._build_paths()
+
+        spec = OpenAPI(info, paths, tags=tags, components=self._components.build())
 
-        return OpenAPI(info, paths, tags=tags, components=self._components.build())
+        if deduplicate:
+            spec = dedupe(spec, threshold)
+
+        return spec
 
     def _build_info(self) -> Info:
         kwargs = {
@@ -203,6 +370,84 @@ class SpecificationBuilder:
         paths = {}
 
         for path, operations in self._paths.items():
-            paths[path] = PathItem(**{k: v.build() for k, v in operations.items()})
+            built = {k: v.build() for k, v in operations.items()}
+            previous, item = self._items.get(path, ({}, None))
+
+            # reuse the previous path item unless an operation was rebuilt or added
+            if len(previous) != len(built) or any(previous.get(k) is not v for k, v in built.items()):
+                item = PathItem(**built)
+                self._items[path] = (built, item)
+
+            paths[path] = item
 
         return paths
+
+
+def _models(sources: Iterable[Any]) -> List[type]:
+    models = []
+
+    for source in sources:
+        if isinstance(source, ModuleType):
+            modules = [source]
+
+            if hasattr(source, '__path__'):
+                prefix = source.__name__ + '.'
+                modules += [importlib.import_module(x.name) for x in pkgutil.walk_packages(source.__path__, prefix)]
+
+            # annotated classes defined in the module itself, not the ones it imports
+            for module in modules:
+                models += [v for k, v in vars(module).items() if not k.startswith('_') and _model(v)
+                           and v.__module__ == module.__name__ and '__annotations__' in vars(v)]
+        elif isinstance(source, type):
+            models.append(source)
+        else:
+            models += list(source)
+
+    return models
+
+
+def _model(value: Any) -> bool:
+    return isinstance(value, type) and value.__module__ not in ('builtins', 'typing') and \
+        not issubclass(value, (Definition, Enum, BaseException)) and Schema.dispatch(value) is None
+
+
+def _dependencies(models: List[type]) -> Dict[type, Tuple[Dict[str, Any], List[type]]]:
+    # properties are read once per model, for the edges and for the schema
+    graph = {}
+    queue = list(models)
+
+    for cls in queue:
+        if cls in graph:
+            continue
+
+        hints = properties(cls)
+        graph[cls] = (hints, [x for hint in hints.values() for x in nested(hint) if _model(x)])
+        queue += graph[cls][1]
+
+    return graph
+
+
+def _topological(graph: Dict[type, Tuple[Dict[str, Any], List[type]]]) -> List[type]:
+    order = []
+    seen = set()
+
+    for root in graph:
+        if root in seen:
+            continue
+
+        seen.add(root)
+        stack = [(root, iter(graph[root][1]))]
+
+        while stack:
+            cls, edges = stack[-1]
+
+            for dependency in edges:
+                if dependency not in seen:
+                    seen.add(dependency)
+                    stack.append((dependency, iter(graph[dependency][1])))
+                    break
+            else:
+                stack.pop()
+                order.append(cls)
+
+    return order
@@ -0,0 +1,211 @@
+from typing import Any, Dict, Iterable
+from openapitools.definitions import OpenAPI, Components, Info
+from openapitools.loader import Raw
+from openapitools.types import Definition, Reference
+
+_methods = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+
+class Bundle:
+    """Merge documents one at a time into one document.
+
+    Components equal to one merged before under the same name are shared, different ones are renamed and every
+    `$ref` to them rewritten. Components and path items are indexed by name and structural hash, so each document
+    costs time proportional to its own size.
+    """
+
+    _components: Dict[str, Dict[str, Any]]
+    _index: Dict[str, Dict[Any, str]]
+    _paths: Dict[str, Any]
+    _tags: Dict[str, Any]
+    _servers: Dict[Any, Any]
+
+    def __init__(self, info: Info = None):
+        self.info = info
+
+        self._components = {k: {} for k in Components.descriptors()}
+        self._index = {k: {} for k in Components.descriptors()}
+        self._paths = {}
+        self._tags = {}
+        self._servers = {}
+
+    def add(self, spec: OpenAPI):
+        if self.info is None:
+            self.info = spec.info
+
+        components = getattr(spec, 'components', None)
+        incoming = {}
+
+        for section in self._components:
+            objects = getattr(components, section, None) if components is not None else None
+
+            # reading through the mapping materializes entries of loaded documents
+            incoming[section] = {name: objects[name] for name in objects or ()}
+
+        renames = self._place(incoming)
+
+        for path in dict.keys(getattr(spec, 'paths', None) or {}):
+            self._path(path, _rewrite(dict.__getitem__(spec.paths, path), renames, {}))
+
+        for tag in getattr(spec, 'tags', None) or ():
+            self._tags.setdefault(tag.name, tag)
+
+        for server in getattr(spec, 'servers', None) or ():
+            self._servers.setdefault(server, server)
+
+    def build(self) -> OpenAPI:
+        if self.info is None:
+            raise ValueError('Nothing to bundle')
+
+        sections = {k: dict(v) for k, v in self._components.items() if v}
+        kwargs = {'components': Components(**sections)}
+
+        if self._tags:
+            kwargs['tags'] = list(self._tags.values())
+
+        if self._servers:
+            kwargs['servers'] = list(self._servers.values())
+
+        return OpenAPI(self.info, dict(self._paths), **kwargs)
+
+    def _place(self, incoming: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        # renamed components change the references of the others, so decide again until the renames settle
+        renames = {}
+
+        for _ in range(sum(len(x) for x in incoming.values()) + 1):
+            memo = {}
+            decided = {}
+            updated = {}
+
+            for section, objects in incoming.items():
+                merged, index = self._components[section], self._index[section]
+                taken = set()
+
+                for name, node in objects.items():
+                    node = _rewrite(node, renames, memo)
+                    existing = merged.get(name)
+
+                    if existing is None and name not in taken or existing is not None and existing == node:
+                        target = name
+                    else:
+                        target = index.get(node) or _fresh(name, merged, taken)
+
+                    taken.add(target)
+                    decided[(section, target)] = node
+
+                    if target != name:
+                        updated[_pointer(section, name)] = _pointer(section, target)
+
+            if updated == renames:
+                break
+
+            renames = updated
+        else:
+            raise ValueError('Component names do not settle')
+
+        for (section, name), node in decided.items():
+            if name not in self._components[section]:
+                self._components[section][name] = node
+                self._index[section].setdefault(node, name)
+
+        return renames
+
+    def _path(self, path: str, item: Any):
+        existing = self._paths.get(path)
+
+        if existing is None:
+            self._paths[path] = item
+            return
+
+        if existing is item or _raw(existing) and _raw(item) and existing._fragment == item._fragment:
+            return
+
+        existing, item = _materialize(existing), _materialize(item)
+        operations = {}
+
+        for method in _methods:
+            a, b = getattr(existing, method, None), getattr(item, method, None)
+
+            if a is not None and b is not None and a != b:
+                raise ValueError('Conflicting operations for %s %s' % (method.upper(), path))
+
+            if a is not None or b is not None:
+                operations[method] = a if a is not None else b
+
+        self._paths[path] = existing.copy(**operations)
+
+
+def bundle(specs: Iterable[OpenAPI], info: Info = None) -> OpenAPI:
+    result = Bundle(info)
+
+    for spec in specs:
+        result.add(spec)
+
+    return result.build()
+
+
+def _pointer(section: str, name: str) -> str:
+    return '#/components/%s/%s' % (section, name.replace('~', '~0').replace('/', '~1'))
+
+
+def _fresh(name: str, merged: Dict[str, Any], taken: set) -> str:
+    i = 2
+
+    while '%s_%d' % (name, i) in merged or '%s_%d' % (name, i) in taken:
+        i += 1
+
+    return '%s_%d' % (name, i)
+
+
+def _raw(value: Any) -> bool:
+    return isinstance(value, Raw)
+
+
+def _materialize(value: Any) -> Any:
+    return value.materialize() if isinstance(value, Raw) else value
+
+
+def _rewrite(value: Any, renames: Dict[str, str], memo: Dict[int, Any]) -> Any:
+    if not renames:
+        return value
+
+    if isinstance(value, Raw):
+        # unparsed entries are parsed only when they mention a renamed component
+        data = value.encode()
+
+        if not any(('"%s"' % x).encode() in data for x in renames):
+            return value
+
+        value = value.materialize()
+
+    if isinstance(value, Reference):
+        return Reference(renames[value.ref]) if value.ref in renames else value
+
+    if isinstance(value, Definition):
+        if id(value) in memo:
+            return memo[id(value)]
+
+        changes = {}
+
+        for name in value._names:
+            item = getattr(value, name)
+            rewritten = _rewrite(item, renames, memo)
+
+            if rewritten is not item:
+                changes[name] = rewritten
+
+        memo[id(value)] = result = value.copy(**changes) if changes else value
+
+        return result
+
+    if isinstance(value, dict):
+        items = {k: _rewrite(v, renames, memo) for k, v in dict.items(value)}
+
+        return items if any(items[k] is not v for k, v in dict.items(value)) else value
+
+    if isinstance(value, list):
+        items = [_rewrite(v, renames, memo) for v in value]
+
+        return items if any(a is not b for a, b in zip(items, value)) else value
+
+    return value
@@ -0,0 +1,183 @@
+import glob
+import hashlib
+import inspect
+import mmap
+import os
+import re
+import tempfile
+import types
+
+from typing import Any, Callable, Optional
+from openapitools import version
+from openapitools.definitions import OpenAPI
+from openapitools.helpers import nested, properties
+from openapitools.loader import load
+
+_library = None
+_address = re.compile(r' at 0x[0-9a-fA-F]+')
+
+
+class BuildCache:
+    """Keep built documents on disk, keyed by a fingerprint of what they were built from."""
+
+    directory: str
+    name: str
+
+    def __init__(self, directory: str, name: str = 'openapi'):
+        self.directory = directory
+        self.name = name
+        self._written = set()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, '%s-%s.json' % (self.name, key))
+
+    def get(self, key: str) -> Optional[OpenAPI]:
+        try:
+            with open(self.path(key), 'rb') as fp:
+                buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+            spec = load(buffer)
+        except (OSError, ValueError):
+            return None
+
+        # the stored bytes are the encoded document, until the tree is changed
+        object.__setattr__(spec, '_fragment', memoryview(buffer))
+
+        return spec
+
+    def put(self, key: str, spec: OpenAPI):
+        os.makedirs(self.directory, exist_ok=True)
+
+        # written aside and renamed, so concurrent workers never read half a file
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix='.%s-' % self.name)
+
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(spec.encode())
+
+        os.replace(temp, self.path(key))
+
+        # only files written here are stale for sure, other caches may share the directory and the name
+        for path in self._written - {self.path(key)}:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        self._written = {self.path(key)}
+
+    def load(self, build: Callable[[], OpenAPI], *sources: Any) -> OpenAPI:
+        """Return the cached document for `sources`, calling `build` and storing its result on a miss."""
+        key = fingerprint(*sources)
+        spec = self.get(key)
+
+        if spec is None:
+            spec = build()
+            self.put(key, spec)
+
+        return spec
+
+
+def fingerprint(*sources: Any) -> str:
+    """Digest the library and `sources`: modules by their file, classes by their properties, functions by code."""
+    digest = hashlib.sha256()
+    digest.update(_fingerprint_library().encode())
+
+    seen = set()
+
+    for source in sources:
+        _update(digest, source, seen)
+
+    return digest.hexdigest()[:32]
+
+
+def _fingerprint_library() -> str:
+    global _library
+
+    if _library is None:
+        digest = hashlib.sha256(version.encode())
+
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.py'))):
+            with open(path, 'rb') as fp:
+                digest.update(fp.read())
+
+        _library = digest.hexdigest()
+
+    return _library
+
+
+def _update(digest, source: Any, seen: set):
+    if isinstance(source, (list, tuple, set, frozenset)):
+        for x in sorted(source, key=repr) if isinstance(source, (set, frozenset)) else source:
+            _update(digest, x, seen)
+    elif isinstance(source, types.ModuleType):
+        digest.update(source.__name__.encode())
+        path = getattr(source, '__file__', None)
+
+        if path and os.path.exists(path):
+            with open(path, 'rb') as fp:
+                digest.update(fp.read())
+    elif isinstance(source, type):
+        if source in seen:
+            return
+
+        seen.add(source)
+        digest.update(('%s.%s' % (source.__module__, source.__qualname__)).encode())
+
+        # classes referenced by properties change the schema as well
+        for name, value in sorted(properties(source).items()):
+            digest.update(('%s=%s' % (name, _describe(value))).encode())
+
+            for cls in nested(value):
+                _update(digest, cls, seen)
+    elif inspect.isfunction(source) or inspect.ismethod(source):
+        digest.update(('%s.%s' % (source.__module__, source.__qualname__)).encode())
+        _update_code(digest, source.__code__)
+    else:
+        digest.update(_repr(source).encode())
+
+
+def _update_code(digest, code: types.CodeType):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+
+    # nested functions are code objects, whose repr holds their address
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code(digest, const)
+        else:
+            digest.update(_constant(const).encode())
+
+
+def _constant(value: Any) -> str:
+    # the order of frozensets follows string hashes, which are salted per process
+    if isinstance(value, frozenset):
+        return 'frozenset({%s})' % ', '.join(sorted(map(_constant, value)))
+
+    if isinstance(value, tuple):
+        return '(%s)' % ', '.join(map(_constant, value))
+
+    return repr(value)
+
+
+def _repr(value: Any) -> str:
+    # an address differs in every process, so the fingerprint would never hit
+    text = repr(value)
+
+    if _address.search(text):
+        raise TypeError('Cannot fingerprint %s, its repr holds an address' % text)
+
+    return text
+
+
+def _describe(value: Any) -> str:
+    # methods and other callables count by name, their repr holds an address
+    if isinstance(value, property):
+        value = value.fget
+    elif isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+
+    if not callable(value) or isinstance(value, type) or hasattr(value, '__origin__'):
+        return _repr(value)
+
+    return '%s.%s' % (getattr(value, '__module__', ''), getattr(value, '__qualname__', type(value).__qualname__))
+
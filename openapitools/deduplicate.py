@@ -0,0 +1,119 @@
+import hashlib
+
+from typing import Any, Dict
+from openapitools.definitions import OpenAPI, Components
+from openapitools.types import Definition, Schema, Reference
+from openapitools.writers import iterencode
+
+
+def deduplicate(spec: OpenAPI, threshold: int = 4) -> OpenAPI:
+    components = getattr(spec, 'components', None) or Components()
+    schemas = dict(getattr(components, 'schemas', None) or {})
+
+    counts = {}
+    sizes = {}
+    names = {}
+
+    for name, schema in schemas.items():
+        size = 1 + sum(_scan(value, counts, sizes) for value in schema.fields.values())
+
+        # registered schemas below the threshold, e.g. a bare Integer, are left inline as well
+        if size >= threshold:
+            names.setdefault(schema, name)
+
+    _scan({k: v for k, v in spec.fields.items() if k != 'components'}, counts, sizes)
+    _scan({k: v for k, v in components.fields.items() if k != 'schemas'}, counts, sizes)
+
+    for schema, count in counts.items():
+        if count < 2 or sizes[schema] < threshold or schema in names:
+            continue
+
+        name = _name(schema, schemas)
+        names[schema] = name
+        schemas[name] = schema
+
+    refs = {schema: Reference("#/components/schemas/%s" % name) for schema, name in names.items()}
+    memo = {}
+
+    schemas = {k: _rewrite(v, refs, memo, top=True) for k, v in schemas.items()}
+    components = _rewrite(components.copy(schemas=None), refs, memo).copy(schemas=schemas)
+
+    return _rewrite(spec.copy(components=None), refs, memo).copy(components=components)
+
+
+def _scan(value: Any, counts: Dict[Schema, int], sizes: Dict[Schema, int]) -> int:
+    if isinstance(value, Schema) and not isinstance(value, Reference):
+        if value in counts:
+            counts[value] += 1
+
+            return sizes[value]
+
+        counts[value] = 1
+        sizes[value] = 1 + sum(_scan(v, counts, sizes) for v in value.fields.values())
+
+        return sizes[value]
+
+    if isinstance(value, Definition):
+        return sum(_scan(v, counts, sizes) for v in value.fields.values())
+
+    if isinstance(value, dict):
+        return sum(_scan(v, counts, sizes) for v in value.values())
+
+    if isinstance(value, list):
+        return sum(_scan(v, counts, sizes) for v in value)
+
+    return 0
+
+
+def _rewrite(value: Any, refs: Dict[Schema, Reference], memo: Dict[int, Any], top: bool = False) -> Any:
+    if isinstance(value, Definition):
+        if id(value) in memo:
+            return memo[id(value)]
+
+        if not top and isinstance(value, Schema) and not isinstance(value, Reference) and value in refs:
+            result = refs[value]
+        else:
+            changes = {}
+
+            for name in value._names:
+                item = getattr(value, name)
+                rewritten = _rewrite(item, refs, memo)
+
+                if rewritten is not item:
+                    changes[name] = rewritten
+
+            result = value.copy(**changes) if changes else value
+
+        if not top:
+            memo[id(value)] = result
+
+        return result
+
+    if isinstance(value, dict):
+        items = {k: _rewrite(v, refs, memo) for k, v in value.items()}
+
+        return items if any(items[k] is not v for k, v in value.items()) else value
+
+    if isinstance(value, list):
+        items = [_rewrite(v, refs, memo) for v in value]
+
+        return items if any(a is not b for a, b in zip(items, value)) else value
+
+    return value
+
+
+def _name(schema: Schema, schemas: Dict[str, Schema]) -> str:
+    title = getattr(schema, 'title', None)
+
+    if title and title not in schemas:
+        return title
+
+    digest = hashlib.sha1(''.join(iterencode(schema)).encode()).hexdigest()
+    name = 'Schema' + digest[:8]
+    i = 1
+
+    while name in schemas:
+        i += 1
+        name = 'Schema%s_%d' % (digest[:8], i)
+
+    return name
@@ -101,17 +101,11 @@ class Parameter(Definition):
     allowEmptyValue: bool
     schema: Schema
 
+    _aliases = {'location': 'in'}
+
     def __init__(self, name, schema: Schema, location: str = 'query', **kwargs):
         super().__init__(name=name, schema=schema, location=location, **kwargs)
 
-    @property
-    def fields(self):
-        values = super().fields
-
-        values['in'] = values.pop('location')
-
-        return values
-
     @staticmethod
     def make(name: str, schema: Any, location: str = 'query', **kwargs):
         if location == 'path':
@@ -145,6 +139,7 @@ class PathItem(Definition):
     head: Operation
     patch: Operation
     trace: Operation
+    parameters: List[Parameter]
 
 
 class SecurityScheme(Definition):
@@ -156,17 +151,11 @@ class SecurityScheme(Definition):
     location: str
     openIdConnectUrl: str
 
+    _aliases = {'location': 'in'}
+
     def __init__(self, _type: str, **kwargs):
         super().__init__(type=_type, **kwargs)
 
-    @property
-    def fields(self):
-        values = super().fields
-
-        values['in'] = values.pop('location')
-
-        return values
-
     @staticmethod
     def make(_type: str, cls: type, **kwargs):
         params = cls.__dict__ if hasattr(cls, '__dict__') else {}
@@ -223,6 +212,8 @@ class Components(Definition):
     links: Dict[str, Link]
     callbacks: Dict[str, Dict[str, PathItem]]
 
+    _entries = True
+
 
 class Tag(Definition):
     name: str
@@ -243,5 +234,7 @@ class OpenAPI(Definition):
     tags: List[Tag]
     externalDocs: ExternalDocumentation
 
+    _entries = True
+
     def __init__(self, info: Info, paths: Dict[str, PathItem], **kwargs):
         super().__init__(openapi="3.0.0", info=info, paths=paths, **kwargs)
@@ -0,0 +1,121 @@
+import json
+
+from typing import Any, List, NamedTuple, Tuple
+from openapitools.definitions import Parameter
+from openapitools.helpers import json_key
+from openapitools.loader import Raw
+from openapitools.types import Definition
+
+
+class Change(NamedTuple):
+    kind: str
+    path: Tuple
+    old: Any
+    new: Any
+
+
+def diff(old: Any, new: Any) -> List[Change]:
+    """List the added, removed and changed values between two documents, subtrees with equal encodings are skipped."""
+    changes = []
+    _diff(old, new, (), changes)
+
+    return changes
+
+
+def _diff(a: Any, b: Any, path: Tuple, changes: List[Change]):
+    if a is b or _same(a, b):
+        return
+
+    if isinstance(a, Raw) or isinstance(b, Raw):
+        a, b = _plain(a), _plain(b)
+
+    if isinstance(a, Definition) and isinstance(b, Definition):
+        _mapping(a.fields, b.fields, path, changes)
+    elif isinstance(a, dict) and isinstance(b, dict):
+        _mapping(a, b, path, changes)
+    elif isinstance(a, list) and isinstance(b, list):
+        _sequence(a, b, path, changes)
+    elif isinstance(a, Definition) and isinstance(b, dict) or isinstance(a, dict) and isinstance(b, Definition):
+        _diff(_plain(a), _plain(b), path, changes)
+    elif a != b:
+        changes.append(Change('changed', path, a, b))
+
+
+def _same(a: Any, b: Any) -> bool:
+    # only exact encodings are trusted, structural hashes collide
+    x, y = _bytes(a, b), _bytes(b, a)
+
+    return x is not None and y is not None and x == y
+
+
+def _bytes(value: Any, other: Any) -> Any:
+    if not isinstance(value, Definition):
+        return None
+
+    # unparsed entries of loaded documents keep their original bytes, built nodes the fragments of encode(cache=True)
+    fragment = getattr(value, '_fragment', None)
+
+    # a built node is encoded once to compare with unparsed bytes, it would be serialized to descend otherwise
+    if fragment is None and isinstance(other, Raw):
+        return value.encode()
+
+    return fragment
+
+
+def _mapping(a: dict, b: dict, path: Tuple, changes: List[Change]):
+    # keys as they are written, empty values are left out of the output as if they were absent
+    x, y = _entries(a), _entries(b)
+
+    for key, value in x.items():
+        other = y.get(key)
+
+        if other is None:
+            changes.append(Change('removed', path + (key,), value, None))
+        else:
+            _diff(value, other, path + (key,), changes)
+
+    for key, value in y.items():
+        if key not in x:
+            changes.append(Change('added', path + (key,), None, value))
+
+
+def _entries(value: dict) -> dict:
+    # dict methods, so lazy mappings hand out their unparsed entries
+    return {k if isinstance(k, str) else json.loads(json_key(k)): v for k, v in dict.items(value) if v}
+
+
+def _sequence(a: list, b: list, path: Tuple, changes: List[Change]):
+    a, b = [x for x in a if x], [x for x in b if x]
+
+    # parameters are matched by location and name, other items by position
+    if a and b and all(_parameter(x) is not None for x in a + b):
+        _mapping({_parameter(x): x for x in a}, {_parameter(x): x for x in b}, path, changes)
+        return
+
+    for i in range(max(len(a), len(b))):
+        if i >= len(b):
+            changes.append(Change('removed', path + (str(i),), a[i], None))
+        elif i >= len(a):
+            changes.append(Change('added', path + (str(i),), None, b[i]))
+        else:
+            _diff(a[i], b[i], path + (str(i),), changes)
+
+
+def _parameter(value: Any) -> Any:
+    if isinstance(value, Parameter):
+        return '%s:%s' % (getattr(value, 'location', ''), getattr(value, 'name', ''))
+
+    if isinstance(value, dict) and 'name' in value and 'in' in value:
+        return '%s:%s' % (value['in'], value['name'])
+
+    return None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Raw):
+        return value.parse()
+
+    if isinstance(value, Definition):
+        return value.serialize()
+
+    return value
@@ -0,0 +1,169 @@
+import base64
+import json
+import threading
+
+from datetime import date, time, datetime
+from types import FunctionType
+from typing import Any, Callable, Optional
+from openapitools.helpers import properties, is_scalar
+
+_lock = threading.RLock()
+_encoders = {}
+_dispatch = {}
+
+converters = {}
+
+
+def register(_type: type, converter: Callable[[Any], Any] = None):
+    """Register `converter(value)` returning the JSON value of `_type` and its subclasses.
+
+    Without `converter` returns a decorator.
+    """
+    if converter is None:
+        return lambda func: register(_type, func)
+
+    with _lock:
+        converters[_type] = converter
+        _dispatch.clear()
+        _encoders.clear()
+
+    return converter
+
+
+def dispatch(_type: type) -> Optional[Callable[[Any], Any]]:
+    try:
+        return _dispatch[_type]
+    except KeyError:
+        pass
+
+    converter = None
+
+    for cls in _type.__mro__:
+        if cls in converters:
+            converter = converters[cls]
+            break
+
+    _dispatch[_type] = converter
+
+    return converter
+
+
+def encoder(value: Any) -> Callable[[Any], Any]:
+    """Return the function converting instances of class or type hint `value` to JSON values, cached per type."""
+    try:
+        return _encoders[value]
+    except KeyError:
+        pass
+
+    with _lock:
+        if value not in _encoders:
+            _make(value)
+
+        return _encoders[value]
+
+
+def dumps(value: Any, hint: Any = None, **kwargs) -> str:
+    # encoders build fresh trees, json needs not look for cycles in them
+    kwargs.setdefault('check_circular', False)
+
+    return json.dumps(encoder(hint if hint is not None else type(value))(value), **kwargs)
+
+
+def _make(value: Any) -> Callable[[Any], Any]:
+    origin = getattr(value, '__origin__', None)
+    args = getattr(value, '__args__', None) or ()
+
+    if origin in (list, tuple, set, frozenset) and args and args[-1] is not Ellipsis:
+        item = _convert(args[0])
+
+        if item is None:
+            func = list
+        else:
+            def func(x):
+                return [None if v is None else item(v) for v in x]
+    elif origin is dict and len(args) == 2:
+        item = _convert(args[1])
+
+        if item is None:
+            func = dict
+        else:
+            def func(x):
+                return {k: None if v is None else item(v) for k, v in x.items()}
+    elif value in (Any, object) or not isinstance(value, type) or dispatch(value) is not None \
+            or is_scalar(value) or issubclass(value, (list, tuple, set, frozenset, dict)):
+        func = dispatch(value) if isinstance(value, type) and value is not Any else None
+        func = func or _generic
+    else:
+        return _object(value)
+
+    _encoders[value] = func
+
+    return func
+
+
+def _object(cls: type) -> Callable[[Any], Any]:
+    # classes may refer to themselves, so the generated function finds its converters through a cell
+    cell = []
+    _encoders[cls] = lambda x: cell[0](x)
+
+    names = {}
+    members = []
+
+    for i, (name, hint) in enumerate(properties(cls).items()):
+        if isinstance(hint, (FunctionType, staticmethod, classmethod)):
+            continue
+
+        if isinstance(hint, property):
+            hint = Any
+        elif not isinstance(hint, type) and not hasattr(hint, '__origin__'):
+            hint = type(hint)
+
+        convert = _convert(hint)
+        access = 'o.%s' % name if name.isidentifier() else 'getattr(o, %r)' % name
+
+        if convert is None:
+            members.append('%s: %s' % (json.dumps(name), access))
+        else:
+            # nulls stay nulls, inlined because a call per member costs more than reading it twice
+            names['_c%d' % i] = convert
+            members.append('%s: None if %s is None else _c%d(%s)' % (json.dumps(name), access, i, access))
+
+    source = 'def encode(o):\n    return {%s}\n' % ', '.join(members)
+    exec(source, names)
+
+    cell.append(names['encode'])
+    _encoders[cls] = names['encode']
+
+    return names['encode']
+
+
+def _convert(hint: Any) -> Optional[Callable[[Any], Any]]:
+    # None for values json encodes as they are
+    if isinstance(hint, type) and is_scalar(hint) and dispatch(hint) is None:
+        return None
+
+    return encoder(hint)
+
+
+def _generic(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)) and dispatch(type(value)) is None:
+        return value
+
+    if isinstance(value, dict):
+        return {k: _generic(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_generic(v) for v in value]
+
+    return encoder(type(value))(value)
+
+
+def _base64(value: bytes) -> str:
+    return base64.b64encode(value).decode('ascii')
+
+
+register(date, date.isoformat)
+register(time, time.isoformat)
+register(datetime, datetime.isoformat)
+register(bytes, _base64)
+register(bytearray, _base64)
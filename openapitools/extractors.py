@@ -0,0 +1,244 @@
+import base64
+import weakref
+
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+from urllib.parse import parse_qs
+from openapitools.definitions import OpenAPI, Components, Operation, Parameter, PathItem
+from openapitools.resolver import Resolver, UnresolvedReference
+from openapitools.types import NodeCache, Schema, Reference
+from openapitools.validators import Compiler
+
+_booleans = {'true': True, 'false': False, '1': True, '0': False}
+
+
+class ParameterError(ValueError):
+    def __init__(self, message: str, name: str, location: str):
+        super().__init__(message)
+
+        self.message = message
+        self.name = name
+        self.location = location
+
+    def __str__(self):
+        return '%s parameter %r: %s' % (self.location, self.name, self.message)
+
+
+class Extractors:
+    compiler: Compiler
+
+    def __init__(self, spec: Union[OpenAPI, Components, Resolver] = None):
+        self.compiler = Compiler(spec)
+
+        self._cache = NodeCache()
+
+    def compile(self, operation: Operation, item: PathItem = None) -> Callable[..., Dict[str, Any]]:
+        """Compile the parameters of `operation`, with those of its path `item` it does not override."""
+        entry = self._cache.get(operation)
+
+        if entry is not None and entry[0]() is item and entry[1] == getattr(item, '_version', None):
+            return entry[2]
+
+        if item is not None:
+            # links the parameters of the path item to it, so changing them bumps its version
+            hash(item)
+
+        func = self._compile(self._parameters(operation, item))
+        ref = weakref.ref(item) if item is not None else lambda: None
+        self._cache.set(operation, (ref, getattr(item, '_version', None), func))
+
+        return func
+
+    def _parameters(self, operation: Operation, item: Optional[PathItem]) -> List[Parameter]:
+        # operation parameters override path item parameters of the same name and location
+        parameters = {}
+
+        for parameter in (getattr(item, 'parameters', None) or []) + (getattr(operation, 'parameters', None) or []):
+            parameter = self._resolve(parameter)
+            parameters[(getattr(parameter, 'name', None), getattr(parameter, 'location', None))] = parameter
+
+        return list(parameters.values())
+
+    def _resolve(self, parameter: Parameter) -> Parameter:
+        # references of loaded documents keep their pointer among the undeclared keys
+        ref = parameter.fields.get('$ref')
+
+        if ref is None:
+            return parameter
+
+        if self.compiler.resolver is None:
+            raise UnresolvedReference(ref)
+
+        return self.compiler.resolver.resolve(ref)
+
+    def _compile(self, parameters: List[Parameter]) -> Callable[..., Dict[str, Any]]:
+        groups = {'path': [], 'query': [], 'header': [], 'cookie': []}
+
+        for parameter in parameters:
+            if getattr(parameter, 'location', None) not in groups:
+                continue
+
+            schema = getattr(parameter, 'schema', None)
+
+            if isinstance(schema, Reference) and self.compiler.resolver is not None:
+                schema = self.compiler.resolver.resolve(schema)
+
+            groups[parameter.location].append((
+                parameter.name if parameter.location != 'header' else parameter.name.lower(),
+                parameter.name,
+                bool(getattr(parameter, 'required', False)),
+                _converter(schema, parameter.location == 'query'),
+                self.compiler.compile(schema) if schema is not None else None,
+                _formatter(schema),
+                getattr(schema, 'default', None),
+            ))
+
+        path, query, header, cookie = groups['path'], groups['query'], groups['header'], groups['cookie']
+
+        def extract(
+            path_params: Mapping[str, str] = None,
+            query_string: Union[str, Mapping[str, Any]] = None,
+            headers: Mapping[str, str] = None,
+            cookies: Union[str, Mapping[str, str]] = None,
+        ) -> Dict[str, Any]:
+            result = {}
+
+            if path:
+                _extract(path, path_params or {}, 'path', result)
+
+            if query:
+                if query_string is None or isinstance(query_string, str):
+                    query_string = parse_qs(query_string or '', keep_blank_values=True)
+
+                _extract(query, query_string, 'query', result)
+
+            if header:
+                _extract(header, {k.lower(): v for k, v in (headers or {}).items()}, 'header', result)
+
+            if cookie:
+                if cookies is None or isinstance(cookies, str):
+                    cookies = _cookies(cookies or '')
+
+                _extract(cookie, cookies, 'cookie', result)
+
+            return result
+
+        return extract
+
+
+_default = Extractors()
+
+
+def extractor(operation: Operation, item: PathItem = None) -> Callable[..., Dict[str, Any]]:
+    return _default.compile(operation, item)
+
+
+def _extract(parameters: List[tuple], values: Mapping[str, Any], location: str, result: Dict[str, Any]):
+    for key, name, required, convert, validate, finish, default in parameters:
+        value = values.get(key)
+
+        if value is None:
+            if required:
+                raise ParameterError('is required', name, location)
+
+            if default is not None:
+                result[name] = default
+
+            continue
+
+        # validated as the json value, formats like dates apply afterwards
+        try:
+            value = convert(value)
+
+            if validate is not None:
+                validate(value)
+
+            if finish is not None:
+                value = finish(value)
+        except (TypeError, ValueError) as e:
+            raise ParameterError(str(e), name, location) from None
+
+        result[name] = value
+
+
+def _converter(schema: Optional[Schema], query: bool) -> Callable[[Any], Any]:
+    _type = getattr(schema, 'type', None)
+
+    if _type == 'array':
+        item = _scalar(getattr(schema, 'items', None))
+
+        # query arrays repeat their key, other locations separate items with commas
+        if query:
+            return lambda x: [item(v) for v in (x if isinstance(x, list) else [x])]
+
+        return lambda x: [item(v) for v in _last(x).split(',')] if _last(x) else []
+
+    convert = _scalar(schema)
+
+    if query:
+        return lambda x: convert(_last(x))
+
+    return convert
+
+
+def _scalar(schema: Optional[Schema]) -> Callable[[str], Any]:
+    _type = getattr(schema, 'type', None)
+
+    if _type == 'integer':
+        return int
+
+    if _type == 'number':
+        return float
+
+    if _type == 'boolean':
+        return _boolean
+
+    return str
+
+
+def _formatter(schema: Optional[Schema]) -> Optional[Callable[[Any], Any]]:
+    if getattr(schema, 'type', None) == 'array':
+        item = _formats.get(getattr(getattr(schema, 'items', None), 'format', None))
+
+        return (lambda x: [item(v) for v in x]) if item is not None else None
+
+    return _formats.get(getattr(schema, 'format', None))
+
+
+def _last(value: Any) -> str:
+    return value[-1] if isinstance(value, list) else value
+
+
+def _boolean(value: str) -> bool:
+    try:
+        return _booleans[value.lower()]
+    except KeyError:
+        raise ValueError('invalid boolean %r' % value) from None
+
+
+def _datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith(('Z', 'z')) else value)
+
+
+def _bytes(value: str) -> bytes:
+    return base64.b64decode(value, validate=True)
+
+
+def _cookies(header: str) -> Dict[str, str]:
+    cookies = {}
+
+    for pair in header.split(';'):
+        name, sep, value = pair.partition('=')
+
+        if sep:
+            cookies.setdefault(name.strip(), value.strip().strip('"'))
+
+    return cookies
+
+
+_formats = {
+    'date': date.fromisoformat,
+    'time': time.fromisoformat,
+    'date-time': _datetime,
+    'byte': _bytes,
+}
@@ -1,4 +1,6 @@
-from typing import Any, Dict, get_type_hints
+import json
+
+from typing import Any, Dict, Iterator, get_type_hints
 
 
 def properties(value: Any) -> Dict:
@@ -7,5 +9,27 @@ def properties(value: Any) -> Dict:
     return {**get_type_hints(value), **fields}
 
 
+def nested(hint: Any) -> Iterator[type]:
+    if isinstance(hint, type) and hint.__module__ not in ('builtins', 'typing'):
+        yield hint
+
+    if isinstance(hint, (list, tuple)):
+        for x in hint:
+            yield from nested(x)
+
+    for arg in getattr(hint, '__args__', None) or ():
+        yield from nested(arg)
+
+
 def is_scalar(value: type) -> bool:
-    return value in [bool, int, float, complex, str]
+    return issubclass(value, (bool, int, float, complex, str))
+
+
+def json_key(value: Any) -> str:
+    if isinstance(value, str):
+        return json.dumps(value)
+
+    if value is None or isinstance(value, (bool, int, float)):
+        return json.dumps(json.dumps(value))
+
+    raise TypeError('keys must be str, int, float, bool or None, not %s' % value.__class__.__name__)
@@ -0,0 +1,253 @@
+import json
+import os
+import re
+
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Union
+from openapitools.types import Schema, Array, Boolean, Date, DateTime, Float, Integer, Long, Object, String
+
+_formats = (
+    ('date-time', re.compile(r'\d{4}-\d\d-\d\d[T ]\d\d:\d\d(:\d\d(\.\d+)?)?(Z|[+-]\d\d:?\d\d)?$')),
+    ('date', re.compile(r'\d{4}-\d\d-\d\d$')),
+)
+_types = {type(None): 'null', bool: 'boolean', int: 'integer', float: 'number', str: 'string', dict: 'object',
+          list: 'array', tuple: 'array'}
+_kinds = ('boolean', 'integer', 'number', 'string', 'array', 'object')
+
+
+class _Shape:
+    # what was observed at one place of the payloads, independent of how many payloads were seen
+    __slots__ = ('count', 'nulls', 'kinds', 'minimum', 'maximum', 'formats', 'objects', 'properties', 'additional',
+                 'items')
+
+    def __init__(self):
+        self.count = 0
+        self.nulls = False
+        self.kinds = set()
+        self.minimum = None
+        self.maximum = None
+        self.formats = None
+        self.objects = 0
+        self.properties = None
+        self.additional = None
+        self.items = None
+
+
+class Inference:
+    """Merge the shapes of many payloads into one schema.
+
+    Memory depends on the distinct shapes seen, not on the number of payloads: arrays merge their items and objects
+    with more than `max_properties` distinct keys are treated as maps with `additionalProperties`.
+    """
+
+    max_properties: int
+    count: int
+
+    def __init__(self, max_properties: int = 1000):
+        self.max_properties = max_properties
+        self.count = 0
+        self._root = _Shape()
+
+    def add(self, payload: Any):
+        _observe(self._root, payload, self.max_properties)
+        self.count += 1
+
+    def update(self, payloads: Iterable[Any]):
+        for payload in payloads:
+            self.add(payload)
+
+    def schema(self) -> Schema:
+        return _schema(self._root)
+
+
+def infer(payloads: Iterable[Any], max_properties: int = 1000) -> Schema:
+    inference = Inference(max_properties)
+    inference.update(payloads)
+
+    return inference.schema()
+
+
+def lines(source: Union[str, os.PathLike, IO]) -> Iterator[Any]:
+    """Yield the payloads of a JSON-lines file, one line at a time."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fp:
+            yield from lines(fp)
+
+        return
+
+    for line in source:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _observe(shape: _Shape, value: Any, limit: int):
+    shape.count += 1
+    kind = _types.get(type(value)) or _classify(value)
+
+    if kind == 'null':
+        shape.nulls = True
+        return
+
+    shape.kinds.add(kind)
+
+    if kind == 'integer':
+        if shape.minimum is None or value < shape.minimum:
+            shape.minimum = value
+
+        if shape.maximum is None or value > shape.maximum:
+            shape.maximum = value
+    elif kind == 'string':
+        # formats every string seen so far matches, once none is left they are not checked anymore
+        if shape.formats is None:
+            shape.formats = {k for k, x in _formats if x.match(value)}
+        elif shape.formats:
+            shape.formats = {k for k, x in _formats if k in shape.formats and x.match(value)}
+    elif kind == 'object':
+        shape.objects += 1
+
+        if shape.additional is not None:
+            for item in value.values():
+                _observe(shape.additional, item, limit)
+
+            return
+
+        if shape.properties is None:
+            shape.properties = {}
+
+        properties = shape.properties
+
+        for key, item in value.items():
+            child = properties.get(key)
+
+            if child is None:
+                child = properties[key] = _Shape()
+
+            _observe(child, item, limit)
+
+        if len(properties) > limit:
+            _collapse(shape, limit)
+    elif kind == 'array':
+        if shape.items is None:
+            shape.items = _Shape()
+
+        for item in value:
+            _observe(shape.items, item, limit)
+
+
+def _classify(value: Any) -> str:
+    # subclasses of the types json produces
+    for _type, kind in _types.items():
+        if isinstance(value, _type):
+            return kind
+
+    raise TypeError('Cannot infer a schema from %s' % value.__class__.__name__)
+
+
+def _collapse(shape: _Shape, limit: int):
+    # too many distinct keys, the object is a map of its values
+    if shape.additional is None:
+        shape.additional = _Shape()
+
+    for child in (shape.properties or {}).values():
+        _merge(shape.additional, child, limit)
+
+    shape.properties = None
+
+
+def _merge(a: _Shape, b: _Shape, limit: int):
+    a.count += b.count
+    a.nulls = a.nulls or b.nulls
+    a.kinds |= b.kinds
+
+    if b.minimum is not None:
+        a.minimum = b.minimum if a.minimum is None else min(a.minimum, b.minimum)
+        a.maximum = b.maximum if a.maximum is None else max(a.maximum, b.maximum)
+
+    if b.formats is not None:
+        a.formats = b.formats if a.formats is None else a.formats & b.formats
+
+    a.objects += b.objects
+
+    if b.additional is not None and a.additional is None:
+        _collapse(a, limit)
+
+    if a.additional is not None:
+        for child in (b.properties or {}).values():
+            _merge(a.additional, child, limit)
+
+        if b.additional is not None:
+            _merge(a.additional, b.additional, limit)
+    elif b.properties is not None:
+        if a.properties is None:
+            a.properties = {}
+
+        for key, child in b.properties.items():
+            if key in a.properties:
+                _merge(a.properties[key], child, limit)
+            else:
+                a.properties[key] = child
+
+        if len(a.properties) > limit:
+            _collapse(a, limit)
+
+    if b.items is not None:
+        if a.items is None:
+            a.items = b.items
+        else:
+            _merge(a.items, b.items, limit)
+
+
+def _schema(shape: _Shape, **kwargs) -> Schema:
+    if shape.nulls:
+        kwargs['nullable'] = True
+
+    kinds = [x for x in _kinds if x in shape.kinds]
+
+    # integers widen to numbers
+    if 'integer' in kinds and 'number' in kinds:
+        kinds.remove('integer')
+
+    if not kinds:
+        kwargs['nullable'] = True
+
+        return Schema(**kwargs)
+
+    if len(kinds) == 1:
+        return _kind(shape, kinds[0], **kwargs)
+
+    return Schema(oneOf=[_kind(shape, x) for x in kinds], **kwargs)
+
+
+def _kind(shape: _Shape, kind: str, **kwargs) -> Schema:
+    if kind == 'boolean':
+        return Boolean(**kwargs)
+
+    if kind == 'integer':
+        return Long(**kwargs) if shape.minimum < -2 ** 31 or shape.maximum >= 2 ** 31 else Integer(**kwargs)
+
+    if kind == 'number':
+        return Float(**kwargs)
+
+    if kind == 'string':
+        if shape.formats and 'date-time' in shape.formats:
+            return DateTime(**kwargs)
+
+        if shape.formats and 'date' in shape.formats:
+            return Date(**kwargs)
+
+        return String(**kwargs)
+
+    if kind == 'array':
+        return Array(_schema(shape.items) if shape.items.count else Schema(nullable=True), **kwargs)
+
+    if shape.additional is not None:
+        return Object(additionalProperties=_schema(shape.additional), **kwargs)
+
+    return Object(_properties(shape), **kwargs)
+
+
+def _properties(shape: _Shape) -> Optional[Dict[str, Schema]]:
+    # present in every object, a null value included
+    return {
+        k: _schema(v, required=True) if v.count == shape.objects else _schema(v)
+        for k, v in (shape.properties or {}).items()
+    } or None
@@ -0,0 +1,352 @@
+import json
+import mmap
+import os
+import re
+import weakref
+
+from collections.abc import ItemsView, ValuesView
+from typing import Any, Callable, Dict, List, Tuple, Union
+from openapitools.definitions import OpenAPI, Components
+from openapitools.types import Definition, Field, Schema, Reference, Boolean, Integer, Long, Float, Double, \
+    String, Byte, Binary, Date, Time, DateTime, Password, Email, Object, Array
+
+_whitespace = re.compile(rb'[ \t\n\r]*')
+_string = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+# strings and everything else up to the next bracket; the branches never overlap, so nothing backtracks
+_content = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*')
+_scalar = re.compile(rb'[^,\]}\s]*')
+
+_schemas = {
+    ('boolean', None): Boolean,
+    ('integer', None): Integer,
+    ('integer', 'int32'): Integer,
+    ('integer', 'int64'): Long,
+    ('number', None): Float,
+    ('number', 'float'): Float,
+    ('number', 'double'): Double,
+    ('string', None): String,
+    ('string', 'byte'): Byte,
+    ('string', 'binary'): Binary,
+    ('string', 'date'): Date,
+    ('string', 'time'): Time,
+    ('string', 'date-time'): DateTime,
+    ('string', 'password'): Password,
+    ('string', 'email'): Email,
+    ('object', None): Object,
+    ('array', None): Array,
+}
+
+
+class Raw(Definition):
+    __slots__ = ('_buffer', '_start', '_end', '_type')
+
+    def __init__(self, buffer, start: int, end: int, _type: Any):
+        super().__init__()
+
+        object.__setattr__(self, '_buffer', buffer)
+        object.__setattr__(self, '_start', start)
+        object.__setattr__(self, '_end', end)
+        object.__setattr__(self, '_type', _type)
+        object.__setattr__(self, '_fragment', memoryview(buffer)[start:end])
+
+    @property
+    def fields(self):
+        return self.parse()
+
+    def parse(self) -> Any:
+        return json.loads(self.encode())
+
+    def materialize(self) -> Any:
+        return _convert(self.parse(), self._type)
+
+    def serialize(self):
+        return self.parse()
+
+    def encode(self, cache: bool = False) -> bytes:
+        return bytes(memoryview(self._buffer)[self._start:self._end])
+
+    def __reduce__(self):
+        return self.__class__, (self.encode(), 0, self._end - self._start, self._type)
+
+
+class LazyMapping(dict):
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+
+        if isinstance(value, Raw):
+            raw, value = value, value.materialize()
+
+            # whoever encoded the raw value now depends on its materialized node
+            if isinstance(value, Definition):
+                object.__setattr__(value, '_parents', raw._parents)
+
+            dict.__setitem__(self, key, value)
+
+        return value
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._changed()
+
+        owner = self._node()
+
+        if owner is not None and isinstance(value, Definition):
+            value.adopt(owner)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._changed()
+
+    def __reduce__(self):
+        return self.__class__, (list(dict.items(self)),), self._node()
+
+    def __setstate__(self, node):
+        self._owner = weakref.ref(node)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            dict.pop(self, key)
+            self._changed()
+
+            return value
+
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._changed()
+
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        dict.clear(self)
+        self._changed()
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def _node(self) -> Any:
+        return self._owner() if getattr(self, '_owner', None) is not None else None
+
+    def _changed(self):
+        # the node holding the mapping drops its cached output, as it does when a field is assigned
+        owner = self._node()
+
+        if owner is not None:
+            owner.touch()
+
+
+def load(source: Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap]) -> OpenAPI:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fp:
+            source = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    table = _table(OpenAPI)
+    fields = {}
+    extra = {}
+
+    def visit(key: str, start: int) -> int:
+        field = table.get(key)
+
+        if key == 'paths' and field is not None:
+            fields[field.name], end = _lazy(source, start, field.type)
+        elif key == 'components' and field is not None:
+            fields[field.name], end = _components(source, start)
+        else:
+            end = _skip(source, start)
+            value = json.loads(bytes(source[start:end]))
+
+            if field is None:
+                extra[key] = value
+            else:
+                fields[field.name] = _convert(value, field.type)
+
+        return end
+
+    _members(source, _space(source, 0), visit)
+
+    return _build(OpenAPI, fields, extra)
+
+
+def _components(buffer, start: int) -> Tuple[Components, int]:
+    table = _table(Components)
+    fields = {}
+    extra = {}
+
+    def visit(key: str, pos: int) -> int:
+        field = table.get(key)
+
+        if field is not None:
+            fields[field.name], end = _lazy(buffer, pos, field.type)
+        else:
+            end = _skip(buffer, pos)
+            extra[key] = json.loads(bytes(buffer[pos:end]))
+
+        return end
+
+    end = _members(buffer, start, visit)
+
+    return _build(Components, fields, extra), end
+
+
+def _lazy(buffer, start: int, hint: Any) -> Tuple['LazyMapping', int]:
+    args = getattr(hint, '__args__', None) or (str, Any)
+    entries = []
+
+    def visit(key: str, pos: int) -> int:
+        end = _skip(buffer, pos)
+        entries.append((key, Raw(buffer, pos, end, args[1])))
+
+        return end
+
+    end = _members(buffer, start, visit)
+
+    return LazyMapping(entries), end
+
+
+def _convert(value: Any, hint: Any) -> Any:
+    origin = getattr(hint, '__origin__', None)
+    args = getattr(hint, '__args__', None) or ()
+
+    if origin in (list, List) and isinstance(value, list) and args:
+        return [_convert(x, args[0]) for x in value]
+
+    if origin in (dict, Dict) and isinstance(value, dict) and len(args) == 2:
+        return {k: _convert(v, args[1]) for k, v in value.items()}
+
+    if origin is Union and isinstance(value, dict):
+        for arg in args:
+            if isinstance(arg, type) and issubclass(arg, Definition):
+                return _convert(value, arg)
+
+    if isinstance(hint, type) and issubclass(hint, Definition) and isinstance(value, dict):
+        if hint is Definition or issubclass(hint, Schema):
+            hint = _schema(value)
+
+        table = _table(hint)
+        fields = {table[k].name: _convert(v, table[k].type) for k, v in value.items() if k in table}
+
+        return _build(hint, fields, {k: v for k, v in value.items() if k not in table})
+
+    return value
+
+
+def _schema(value: Dict[str, Any]) -> type:
+    if '$ref' in value:
+        return Reference
+
+    return _schemas.get((value.get('type'), value.get('format')), None) or \
+        _schemas.get((value.get('type'), None), Schema)
+
+
+def _build(cls: type, fields: Dict[str, Any], extra: Dict[str, Any] = None) -> Definition:
+    node = cls.__new__(cls)
+    node._assign(fields)
+
+    if extra:
+        object.__setattr__(node, '_extra', extra)
+
+    # link children right away, so changes to them reach the parents of the materialized node
+    for value in fields.values():
+        _adopt(value, node)
+
+        if isinstance(value, LazyMapping):
+            value._owner = weakref.ref(node)
+
+    return node
+
+
+def _adopt(value: Any, parent: Definition):
+    if isinstance(value, Definition):
+        value.adopt(parent)
+    elif isinstance(value, dict):
+        for x in dict.values(value):
+            _adopt(x, parent)
+    elif isinstance(value, list):
+        for x in value:
+            _adopt(x, parent)
+
+
+def _table(cls: type) -> Dict[str, Field]:
+    return {x.key: x for x in cls.descriptors().values()}
+
+
+def _members(buffer, pos: int, visit: Callable[[str, int], int]) -> int:
+    # visit(key, start) handles the value at start and returns where it ends
+    if buffer[pos:pos + 1] != b'{':
+        raise ValueError('Expecting object at %d' % pos)
+
+    pos = _space(buffer, pos + 1)
+
+    if buffer[pos:pos + 1] == b'}':
+        return pos + 1
+
+    while True:
+        match = _string.match(buffer, pos)
+
+        if match is None:
+            raise ValueError('Expecting property name at %d' % pos)
+
+        key = json.loads(match.group())
+        pos = _space(buffer, match.end())
+
+        if buffer[pos:pos + 1] != b':':
+            raise ValueError("Expecting ':' delimiter at %d" % pos)
+
+        pos = _space(buffer, visit(key, _space(buffer, pos + 1)))
+        delimiter = buffer[pos:pos + 1]
+
+        if delimiter == b'}':
+            return pos + 1
+
+        if delimiter != b',':
+            raise ValueError("Expecting ',' delimiter at %d" % pos)
+
+        pos = _space(buffer, pos + 1)
+
+
+def _skip(buffer, pos: int) -> int:
+    char = buffer[pos:pos + 1]
+
+    if char == b'"':
+        return _string.match(buffer, pos).end()
+
+    if char not in (b'{', b'['):
+        return _scalar.match(buffer, pos).end()
+
+    depth = 0
+
+    while True:
+        # strings and scalars in one match, so the loop only sees brackets
+        pos = _content.match(buffer, pos).end()
+        char = buffer[pos:pos + 1]
+
+        if not char:
+            raise ValueError('Unterminated value')
+
+        depth += 1 if char in (b'{', b'[') else -1
+        pos += 1
+
+        if depth == 0:
+            return pos
+
+
+def _space(buffer, pos: int) -> int:
+    return _whitespace.match(buffer, pos).end()
@@ -0,0 +1,187 @@
+from typing import Any, Dict, List, Tuple, Union
+from openapitools.definitions import OpenAPI, Components
+from openapitools.types import Definition, Reference
+
+
+class UnresolvedReference(LookupError):
+    pass
+
+
+class CircularReference(ValueError):
+    pass
+
+
+class Resolver:
+    _index: Dict[str, Tuple[dict, str]]
+    _resolved: Dict[str, Any]
+    _paths: Dict[str, Any]
+
+    def __init__(self, spec: Union[OpenAPI, Components]):
+        components = spec if isinstance(spec, Components) else getattr(spec, 'components', None)
+
+        self._index = {}
+        self._resolved = {}
+        self._paths = {} if isinstance(spec, Components) else getattr(spec, 'paths', None) or {}
+
+        for section, objects in (components.fields if components is not None else {}).items():
+            for name in objects or ():
+                self._index['#/components/%s/%s' % (section, escape(name))] = (objects, name)
+
+    def __contains__(self, pointer: str) -> bool:
+        return pointer in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, pointer: str) -> Any:
+        try:
+            objects, name = self._index[pointer]
+        except KeyError:
+            raise UnresolvedReference(pointer) from None
+
+        return objects[name]
+
+    def resolve(self, value: Union[str, Reference]) -> Any:
+        pointer = _pointer(value)
+
+        if pointer is None:
+            return value
+
+        if pointer in self._resolved:
+            return self._resolved[pointer]
+
+        chain = [pointer]
+        target = self.get(pointer)
+
+        while _pointer(target) is not None:
+            pointer = _pointer(target)
+
+            if pointer in self._resolved:
+                target = self._resolved[pointer]
+                break
+
+            if pointer in chain:
+                raise CircularReference(' -> '.join(chain + [pointer]))
+
+            chain.append(pointer)
+            target = self.get(pointer)
+
+        for x in chain:
+            self._resolved[x] = target
+
+        return target
+
+    def check(self) -> Tuple[List[Tuple[str, str]], List[List[str]]]:
+        # one walk over every component and path collects the reference graph, cycles come from its strong components
+        unresolved = []
+        graph = {}
+
+        for pointer, (objects, name) in self._index.items():
+            edges = graph[pointer] = []
+
+            for location, ref in _references(dict.__getitem__(objects, name), pointer):
+                if ref in self._index:
+                    edges.append(ref)
+                else:
+                    unresolved.append((location, ref))
+
+        for path, item in dict.items(self._paths):
+            for location, ref in _references(item, '#/paths/%s' % escape(path)):
+                if ref not in self._index:
+                    unresolved.append((location, ref))
+
+        return unresolved, _cycles(graph)
+
+
+def escape(token: str) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _pointer(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+
+    if isinstance(value, Reference):
+        return value.ref
+
+    # loaded references to responses, parameters and the like keep `$ref` among their undeclared keys
+    if isinstance(value, Definition) and isinstance((getattr(value, '_extra', None) or {}).get('$ref'), str):
+        return value._extra['$ref']
+
+    if isinstance(value, dict) and isinstance(value.get('$ref'), str) and len(value) == 1:
+        return value['$ref']
+
+    return None
+
+
+def _references(value: Any, location: str):
+    stack = [(value, location)]
+
+    while stack:
+        value, location = stack.pop()
+
+        # fields hold `$ref` of references, of undeclared keys of loaded nodes and of unparsed entries alike
+        if isinstance(value, Definition):
+            value = value.fields
+
+        if isinstance(value, dict):
+            if isinstance(value.get('$ref'), str):
+                yield location, value['$ref']
+            else:
+                # dict.items, so unparsed entries of loaded documents are scanned without being materialized
+                stack.extend((v, '%s/%s' % (location, escape(k))) for k, v in dict.items(value))
+        elif isinstance(value, list):
+            stack.extend((v, '%s/%d' % (location, i)) for i, v in enumerate(value))
+
+
+def _cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+    # iterative Tarjan, a strong component is a cycle when it has several nodes or a self reference
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    cycles = []
+
+    for root in graph:
+        if root in index:
+            continue
+
+        work = [(root, iter(graph[root]))]
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, edges = work[-1]
+
+            for edge in edges:
+                if edge not in index:
+                    index[edge] = low[edge] = len(index)
+                    stack.append(edge)
+                    on_stack.add(edge)
+                    work.append((edge, iter(graph[edge])))
+                    break
+
+                if edge in on_stack:
+                    low[node] = min(low[node], index[edge])
+            else:
+                work.pop()
+
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+
+                if low[node] == index[node]:
+                    component = []
+
+                    while True:
+                        x = stack.pop()
+                        on_stack.discard(x)
+                        component.append(x)
+
+                        if x == node:
+                            break
+
+                    if len(component) > 1 or node in graph[node]:
+                        cycles.append(component[::-1])
+
+    return cycles
@@ -0,0 +1,114 @@
+import re
+
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote
+from openapitools.definitions import OpenAPI, Operation, PathItem
+
+_parameter = re.compile(r'{([^{}]+)}')
+_methods = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+
+class _Node:
+    __slots__ = ('static', 'params', 'operations')
+
+    def __init__(self):
+        self.static = {}
+        self.params = []
+        self.operations = {}
+
+
+class Router:
+    """Segment trie over the templated paths of a document, matching in time proportional to the path length."""
+
+    def __init__(self, paths: Union[OpenAPI, Dict[str, PathItem]]):
+        self._root = _Node()
+
+        for path, item in (paths.paths if isinstance(paths, OpenAPI) else paths).items():
+            self.add(path, item)
+
+    def add(self, path: str, item: PathItem):
+        node = self._root
+        names = []
+
+        for segment in path.split('/'):
+            found = _parameter.findall(segment)
+
+            if not found:
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            names.extend(found)
+
+            # a whole segment parameter needs no regex, templates like {name}.{ext} get one
+            pattern = None if _parameter.fullmatch(segment) else re.compile(
+                ''.join('([^/]+)' if i % 2 else re.escape(x) for i, x in enumerate(_parameter.split(segment)))
+            )
+            key = pattern.pattern if pattern is not None else None
+
+            for other, child in node.params:
+                if (other.pattern if other is not None else None) == key:
+                    node = child
+                    break
+            else:
+                child = _Node()
+                node.params.append((pattern, child))
+                node = child
+
+        for method in _methods:
+            operation = getattr(item, method, None)
+
+            if operation is not None:
+                node.operations[method] = (operation, tuple(names))
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Operation, Dict[str, str]]]:
+        values = []
+        found = _find(self._root, path.split('/'), 0, method.lower(), values)
+
+        if found is None:
+            return None
+
+        operation, names = found
+
+        return operation, {k: unquote(v) if '%' in v else v for k, v in zip(names, values)}
+
+    def methods(self, path: str) -> List[str]:
+        return [x for x in _methods if _find(self._root, path.split('/'), 0, x, []) is not None]
+
+
+def _find(node: _Node, segments: List[str], i: int, method: str, values: List[str]):
+    if i == len(segments):
+        return node.operations.get(method)
+
+    segment = segments[i]
+    child = node.static.get(segment)
+
+    # literal segments take precedence over templated ones
+    if child is not None:
+        found = _find(child, segments, i + 1, method, values)
+
+        if found is not None:
+            return found
+
+    if not segment:
+        return None
+
+    for pattern, child in node.params:
+        if pattern is None:
+            groups = (segment,)
+        else:
+            match = pattern.fullmatch(segment)
+
+            if match is None:
+                continue
+
+            groups = match.groups()
+
+        values.extend(groups)
+        found = _find(child, segments, i + 1, method, values)
+
+        if found is not None:
+            return found
+
+        del values[len(values) - len(groups):]
+
+    return None
@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+import io
+import json
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from openapitools.definitions import OpenAPI
+from openapitools.types import Definition, NodeCache
+
+_digests = NodeCache()
+
+
+def canonical(value: Any) -> bytes:
+    """Encode `value` as JSON with sorted keys and no insignificant whitespace."""
+    return json.dumps(_normalize(value), sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def content_hash(value: Any) -> str:
+    """Return the sha256 hex digest of the canonical JSON of `value`, cached per definition until it is touched."""
+    if not isinstance(value, Definition):
+        return hashlib.sha256(canonical(value)).hexdigest()
+
+    digest = _digests.get(value)
+
+    if digest is None:
+        digest = hashlib.sha256(canonical(value)).hexdigest()
+        _digests.set(value, digest)
+
+    return digest
+
+
+class Document:
+    body: bytes
+    compressed: bytes
+    etag: str
+
+    def __init__(self, spec: OpenAPI):
+        self.body = spec.encode()
+        self.compressed = _compress(self.body)
+        self.etag = content_hash(spec)
+
+    def respond(self, method: str, headers: Dict[str, str]) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        if method not in ('GET', 'HEAD'):
+            return 405, [('Allow', 'GET, HEAD'), ('Content-Length', '0')], b''
+
+        compress = 'gzip' in headers.get('accept-encoding', '')
+        etag = '"%s%s"' % (self.etag, '-gzip' if compress else '')
+        response = [('ETag', etag), ('Cache-Control', 'no-cache'), ('Vary', 'Accept-Encoding')]
+
+        if _matches(headers.get('if-none-match'), self.etag):
+            return 304, response, b''
+
+        body = self.compressed if compress else self.body
+        response.append(('Content-Type', 'application/json'))
+        response.append(('Content-Length', str(len(body))))
+
+        if compress:
+            response.append(('Content-Encoding', 'gzip'))
+
+        return 200, response, body if method == 'GET' else b''
+
+
+class WSGIApp:
+    """Serve a document from pre-encoded bytes, answering `If-None-Match` with `304 Not Modified`."""
+
+    _statuses = {200: '200 OK', 304: '304 Not Modified', 405: '405 Method Not Allowed'}
+
+    def __init__(self, spec: OpenAPI):
+        self.update(spec)
+
+    def update(self, spec: OpenAPI):
+        self.document = Document(spec)
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        headers = {
+            'accept-encoding': environ.get('HTTP_ACCEPT_ENCODING', ''),
+            'if-none-match': environ.get('HTTP_IF_NONE_MATCH'),
+        }
+        status, response, body = self.document.respond(environ.get('REQUEST_METHOD', 'GET'), headers)
+        start_response(self._statuses[status], response)
+
+        return [body]
+
+
+class ASGIApp:
+    """ASGI counterpart of `WSGIApp`."""
+
+    def __init__(self, spec: OpenAPI):
+        self.update(spec)
+
+    def update(self, spec: OpenAPI):
+        self.document = Document(spec)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope['type'] != 'http':
+            return
+
+        headers = {k.decode('latin-1').lower(): v.decode('latin-1') for k, v in scope.get('headers') or ()}
+        status, response, body = self.document.respond(scope.get('method', 'GET'), headers)
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in response],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def _compress(data: bytes) -> bytes:
+    # no timestamp in the header, so equal documents compress to equal bytes
+    buffer = io.BytesIO()
+
+    with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as fp:
+        fp.write(data)
+
+    return buffer.getvalue()
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+
+    for tag in header.split(','):
+        tag = tag.strip()
+
+        if tag.startswith('W/'):
+            tag = tag[2:]
+
+        if tag == '*' or tag.strip('"') in (etag, etag + '-gzip'):
+            return True
+
+    return False
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Definition):
+        value = value.serialize()
+
+    if isinstance(value, dict):
+        # keys as json writes them, so int and str keys sort together
+        return {k if isinstance(k, str) else json.dumps(k): _normalize(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+
+    return value
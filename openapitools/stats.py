@@ -0,0 +1,160 @@
+import functools
+import time
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict
+from openapitools.builders import OperationBuilder, SpecificationBuilder
+from openapitools.types import Definition, Registry, Schema
+
+
+class Stats:
+    calls: Counter
+    time: Dict[str, float]
+    nodes: Counter
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = Counter()
+        self.time = defaultdict(float)
+        self.nodes = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': dict(self.calls),
+            'time': dict(self.time),
+            'nodes': dict(self.nodes),
+            'definitions': {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate},
+        }
+
+
+stats = Stats()
+
+_targets = (
+    (Schema, 'make', 'Schema.make'),
+    (Definition, 'guard', 'Definition.guard'),
+    (Definition, 'serialize', 'Definition.serialize'),
+    (Definition, 'encode', 'Definition.encode'),
+    (OperationBuilder, 'build', 'OperationBuilder.build'),
+    (SpecificationBuilder, 'build', 'SpecificationBuilder.build'),
+)
+_originals = {}
+_callback = None
+
+
+def enable(callback: Callable[[str, float], None] = None) -> Stats:
+    """Instrument the library and return the shared `Stats`.
+
+    `callback(name, seconds)` is called after each instrumented call, e.g. to forward timings to a metrics system.
+    Nothing is wrapped until this is called, so disabled instrumentation costs nothing.
+    """
+    global _callback
+
+    _callback = callback
+
+    if _originals:
+        return stats
+
+    for owner, attribute, name in _targets:
+        _patch(owner, attribute, _timed(owner.__dict__[attribute], name))
+
+    _patch(Schema, '_make', _memoized(Schema.__dict__['_make']))
+    _patch(Definition, '_assign', _counted(Definition.__dict__['_assign']))
+
+    return stats
+
+
+def disable():
+    global _callback
+
+    for (owner, attribute), original in _originals.items():
+        setattr(owner, attribute, original)
+
+    _originals.clear()
+    _callback = None
+
+
+@contextmanager
+def instrumented(callback: Callable[[str, float], None] = None):
+    enable(callback)
+
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def _patch(owner: type, attribute: str, value):
+    _originals[(owner, attribute)] = owner.__dict__[attribute]
+    setattr(owner, attribute, value)
+
+
+def _unwrap(value) -> Callable:
+    return value.__func__ if isinstance(value, staticmethod) else value
+
+
+def _rewrap(original, func: Callable):
+    return staticmethod(func) if isinstance(original, staticmethod) else func
+
+
+def _timed(original, name: str):
+    func = _unwrap(original)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+
+            stats.calls[name] += 1
+            stats.time[name] += elapsed
+
+            if _callback is not None:
+                _callback(name, elapsed)
+
+    return _rewrap(original, wrapper)
+
+
+def _memoized(original):
+    func = _unwrap(original)
+
+    @functools.wraps(func)
+    def wrapper(value, **kwargs):
+        # only classes without a handler go through the definitions memo
+        if isinstance(value, type) and not isinstance(getattr(value, '__origin__', None), type) \
+                and Schema.dispatch(value) is None:
+            registry = Registry.current()
+
+            if value in registry.definitions:
+                stats.hits += 1
+            elif value not in registry.pending:
+                stats.misses += 1
+
+        return func(value, **kwargs)
+
+    return _rewrap(original, wrapper)
+
+
+def _counted(func: Callable):
+    @functools.wraps(func)
+    def wrapper(self, fields):
+        stats.nodes[self.__class__.__name__] += 1
+
+        return func(self, fields)
+
+    return wrapper
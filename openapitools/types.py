@@ -1,32 +1,235 @@
 import json
+import threading
+import weakref
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, time, datetime
-from typing import List, Dict, Any, Union
-from openapitools.helpers import properties, is_scalar
+from typing import List, Dict, Any, Union, Callable, Iterator, Optional, get_type_hints
+from openapitools.helpers import properties, is_scalar, json_key
 
 
-class Definition:
-    __fields: dict
+class Field:
+    __slots__ = ('name', 'key', 'type')
+
+    def __init__(self, name: str, key: str, _type: Any):
+        self.name = name
+        self.key = key
+        self.type = _type
+
+    def __repr__(self):
+        return 'Field(%r, %r, %r)' % (self.name, self.key, self.type)
+
+
+_shapes = {}
+
+
+class DefinitionMeta(type):
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if '__slots__' not in namespace:
+            inherited = {x for base in bases for cls in base.__mro__ for x in getattr(cls, '__slots__', ())}
+            annotated = [x for x in namespace.get('__annotations__', {}) if not x.startswith('_')]
+
+            slots = [x for x in annotated if x not in inherited and x not in namespace]
+
+            # annotated fields with a class level default can not become slots
+            if any(x in namespace for x in annotated) and '__dict__' not in inherited:
+                slots.append('__dict__')
+
+            namespace['__slots__'] = tuple(slots)
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class Definition(metaclass=DefinitionMeta):
+    __slots__ = ('__weakref__', '_names', '_extra', '_fragment', '_hash', '_parents', '_version')
+
+    _aliases = {}
+    _descriptors = None
+    _entries = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._descriptors = None
 
     def __init__(self, **kwargs):
-        self.__fields = self.guard(kwargs)
+        self._assign(self.guard(kwargs))
+
+    def _assign(self, fields: Dict[str, Any]):
+        setter = object.__setattr__
+
+        for k, v in fields.items():
+            setter(self, k, v)
+
+        # names of the set fields, so reads never probe empty slots; shared between nodes of one shape
+        names = tuple(fields)
+        setter(self, '_names', _shapes.setdefault(names, names))
+        setter(self, '_extra', None)
+        setter(self, '_fragment', None)
+        setter(self, '_hash', None)
+        setter(self, '_parents', None)
+        setter(self, '_version', 0)
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+
+        if not key.startswith('_'):
+            # nodes made by __new__, e.g. while unpickling, have no names yet
+            current = getattr(self, '_names', ())
+
+            if key not in current and key in self.descriptors():
+                names = current + (key,)
+                object.__setattr__(self, '_names', _shapes.setdefault(names, names))
+
+            self.touch()
+
+    def __delattr__(self, key):
+        object.__delattr__(self, key)
+
+        if not key.startswith('_'):
+            names = tuple(x for x in getattr(self, '_names', ()) if x != key)
+            object.__setattr__(self, '_names', _shapes.setdefault(names, names))
+
+            self.touch()
+
+    @classmethod
+    def descriptors(cls) -> Dict[str, Field]:
+        if cls._descriptors is None:
+            hints = get_type_hints(cls)
+
+            cls._descriptors = {
+                k: Field(k, cls._aliases.get(k, k), v) for k, v in hints.items() if not k.startswith('_')
+            }
+
+        return cls._descriptors
 
     @property
     def fields(self):
-        return self.__fields
+        if not self._aliases:
+            fields = {k: getattr(self, k) for k in self._names}
+        else:
+            table = self.descriptors()
+            fields = {table[k].key: getattr(self, k) for k in self._names}
+
+        # keys of loaded documents the object model does not declare, written back as they were read
+        extra = getattr(self, '_extra', None)
+
+        if extra:
+            fields.update((k, v) for k, v in extra.items() if k not in fields)
+
+        return fields
 
     def guard(self, fields):
-        return {k: v for k, v in fields.items() if k in properties(self.__class__).keys()}
+        table = self.descriptors()
+
+        return {k: v for k, v in fields.items() if k in table}
+
+    def __getstate__(self):
+        # fields only, cached output and parent references are rebuilt on demand
+        return {k: getattr(self, k) for k in self._names}, getattr(self, '_extra', None)
+
+    def __setstate__(self, state):
+        fields, extra = state
+        self._assign(fields)
+        object.__setattr__(self, '_extra', extra)
+
+    def copy(self, **changes):
+        clone = self.__class__.__new__(self.__class__)
+        clone._assign({**{k: getattr(self, k) for k in self._names}, **changes})
+        object.__setattr__(clone, '_extra', getattr(self, '_extra', None))
+
+        return clone
+
+    def touch(self):
+        # drop cached output of this definition and of every definition serialized with it
+        nodes = [self]
+
+        while nodes:
+            node = nodes.pop()
+            parents = getattr(node, '_parents', None)
+
+            object.__setattr__(node, '_fragment', None)
+            object.__setattr__(node, '_hash', None)
+            object.__setattr__(node, '_parents', None)
+            object.__setattr__(node, '_version', getattr(node, '_version', 0) + 1)
+
+            refs = (parents,) if isinstance(parents, weakref.ref) else (parents or {}).values()
+            nodes.extend(x for x in (ref() for ref in refs) if x is not None)
+
+    def adopt(self, parent: 'Definition'):
+        # most nodes have one parent, held by a single reference until a second one adopts them
+        parents = getattr(self, '_parents', None)
+
+        if isinstance(parents, weakref.ref):
+            current = parents()
+
+            if current is parent:
+                return
+
+            parents = {id(current): parents} if current is not None else None
+
+        if parents is None:
+            object.__setattr__(self, '_parents', weakref.ref(parent))
+            return
+
+        object.__setattr__(self, '_parents', parents)
+
+        ref = parents.get(id(parent))
+
+        if ref is None or ref() is not parent:
+            parents[id(parent)] = weakref.ref(parent)
+
+            # forget collected parents, amortized over doubling sizes
+            if len(parents) & (len(parents) - 1) == 0:
+                for key in [k for k, v in parents.items() if v() is None]:
+                    del parents[key]
 
     def serialize(self):
         return _serialize(self.fields)
 
+    def encode(self, cache: bool = False) -> bytes:
+        """Return the JSON of this definition, joined from the bytes kept by its children.
+
+        With `cache` the entries of mappings held by classes with `_entries`, path items and components,
+        keep their bytes until they are changed, so encoding again only encodes the changed entries.
+        """
+        fragment = getattr(self, '_fragment', None)
+
+        if fragment is not None:
+            return fragment if isinstance(fragment, bytes) else bytes(fragment)
+
+        fields = self.fields
+
+        if cache and self._entries:
+            for value in fields.values():
+                if isinstance(value, dict):
+                    for entry in dict.values(value):
+                        if isinstance(entry, Definition) and getattr(entry, '_fragment', None) is None:
+                            object.__setattr__(entry, '_fragment', entry.encode(cache))
+
+        return b''.join(_encode(fields, self, cache))
+
+    def view(self) -> memoryview:
+        """Return the JSON of this definition as a view, without copying the bytes it keeps, e.g. a cached file."""
+        fragment = getattr(self, '_fragment', None)
+
+        return memoryview(self.encode() if fragment is None else fragment)
+
     def __str__(self):
         return json.dumps(self.serialize())
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if isinstance(other, self.__class__):
-            return isinstance(other, self.__class__) and self.__fields == other.__fields
+            a, b = getattr(self, '_hash', None), getattr(other, '_hash', None)
+
+            if a is not None and b is not None and a != b:
+                return False
+
+            return self.fields == other.fields
 
         return False
 
@@ -34,7 +237,92 @@ class Definition:
         return not(self == other)
 
     def __hash__(self):
-        return hash(self)
+        value = getattr(self, '_hash', None)
+
+        if value is None:
+            value = hash(_freeze(self.fields, self))
+            object.__setattr__(self, '_hash', value)
+
+        return value
+
+
+class NodeCache:
+    """Keep a value computed from a definition until the definition or a node below it is changed.
+
+    Changes are seen through `touch()`, which bumps the version of the changed node and of its parents.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, node: Definition, default: Any = None) -> Any:
+        entry = self._entries.get(id(node))
+
+        if entry is not None and entry[0]() is node and entry[1] == node._version:
+            return entry[2]
+
+        return default
+
+    def set(self, node: Definition, value: Any):
+        # hashing links every node below to its parents, so touching any of them reaches this one
+        hash(node)
+
+        key = id(node)
+        entries = self._entries
+
+        with self._lock:
+            entries[key] = (weakref.ref(node, lambda _: entries.pop(key, None)), node._version, value)
+
+
+class Registry:
+    definitions: Dict[type, 'Schema']
+    pending: set
+    recursive: set
+    references: Dict[type, 'Reference']
+    interned: Optional[Dict['Schema', 'Schema']]
+    lock: threading.RLock
+
+    def __init__(self, intern: bool = False):
+        self.definitions = {}
+        self.pending = set()
+        self.recursive = set()
+        self.references = {}
+        self.interned = {} if intern else None
+        self.lock = threading.RLock()
+
+    def intern(self, schema: 'Schema') -> 'Schema':
+        if self.interned is None:
+            return schema
+
+        try:
+            with self.lock:
+                return self.interned.setdefault(schema, schema)
+        except TypeError:  # unhashable default or example
+            return schema
+
+    def components(self) -> Dict[str, 'Schema']:
+        return {cls.__name__: self.definitions[cls] for cls in self.recursive}
+
+    def activate(self):
+        _registry.set(self)
+
+    @contextmanager
+    def scope(self):
+        token = _registry.set(self)
+
+        try:
+            yield self
+        finally:
+            _registry.reset(token)
+
+    @staticmethod
+    def current() -> 'Registry':
+        return _registry.get()
+
+
+# each thread and asyncio task sees the registry of the builder it created or entered
+_registry = ContextVar('openapitools.registry', default=Registry())
 
 
 class Schema(Definition):
@@ -50,86 +338,125 @@ class Schema(Definition):
     anyOf: List[Definition]
     allOf: List[Definition]
 
-    definitions = {}
+    handlers = {}
+
+    _dispatch = {}
 
     @staticmethod
-    def make(value, **kwargs):
+    def register(_type: type, handler: Callable = None):
+        """Register `handler(value, **kwargs)` building the schema of `_type` and its subclasses.
+
+        Subclasses that declare annotations are models, their properties are read instead.
+
+        A Schema subclass may be given instead of a function, it will be called with `kwargs` only.
+        Without `handler` returns a decorator.
+        """
+        if handler is None:
+            return lambda func: Schema.register(_type, func)
+
+        if isinstance(handler, type) and issubclass(handler, Schema):
+            cls = handler
+            handler = lambda value, **kwargs: cls(**kwargs)  # noqa: E731
+
+        Schema.handlers[_type] = handler
+        Schema._dispatch.clear()
+
+        return handler
+
+    @staticmethod
+    def dispatch(_type: type) -> Optional[Callable]:
+        try:
+            return Schema._dispatch[_type]
+        except KeyError:
+            pass
+
+        handler = None
+
+        for cls in _type.__mro__:
+            if cls is object and _type is not object:
+                break
+
+            if cls in Schema.handlers:
+                handler = Schema.handlers[cls]
+                break
+
+            # annotated subclasses of registered types, e.g. a TypedDict, are models
+            if '__annotations__' in vars(cls):
+                break
+
+        Schema._dispatch[_type] = handler
+
+        return handler
+
+    @staticmethod
+    def make(value, registry: Registry = None, **kwargs):
+        if registry is not None and registry is not _registry.get():
+            with registry.scope():
+                return registry.intern(Schema._make(value, **kwargs))
+
+        return _registry.get().intern(Schema._make(value, **kwargs))
+
+    @staticmethod
+    def _make(value, **kwargs):
         if isinstance(value, Schema):
             return value
 
         if value is None:
             return Schema(nullable=True)
 
-        _type = type(value)
+        if isinstance(getattr(value, '__origin__', None), type):
+            _type = value.__origin__
+        elif isinstance(value, type):
+            _type = value
+        else:
+            _type = type(value)
+
+            if is_scalar(_type):
+                kwargs['default'] = value
 
-        if is_scalar(_type):
-            kwargs['default'] = value
+        handler = Schema.dispatch(_type)
 
-        if _type == type:
-            _type = value
+        if handler is not None:
+            return handler(value, **kwargs)
 
-        if _type == bool:
-            return Boolean(**kwargs)
-        elif _type == int:
-            return Integer(**kwargs)
-        elif _type == float:
-            return Float(**kwargs)
-        elif _type == complex:
-            return Float(**kwargs)  # TODO format?
-        elif _type == str:
-            return String(**kwargs)
-        elif _type == bytes:
-            return Byte(**kwargs)
-        elif _type == bytearray:
-            return Binary(**kwargs)
-        elif _type == object:
-            return Object(**kwargs)
-        elif _type == date:
-            return Date(**kwargs)
-        elif _type == time:
-            return Time(**kwargs)
-        elif _type == datetime:
-            return DateTime(**kwargs)
-        elif _type == list:
-            _items = Schema(nullable=True)
-
-            if value != list:
-                if len(value) == 1:
-                    _items = Schema.make(value[0])
-                elif len(value) > 1:
-                    _items = Schema(oneOf=[Schema.make(x) for x in value])
-
-            return Array(_items, **kwargs)
-        elif _type == range:
-            args = {}
-
-            if value != range:
-                args = {
-                    'minimum': min(value),
-                    'maximum': max(value)
-                }
-
-            return Array(Integer(**args), **kwargs)
-        elif _type == dict:
-            _properties = None
-
-            if value != dict:
-                _properties = {k: Schema.make(v) for k, v in value.items()}
-
-            return Object(_properties, **kwargs)
-        else:
-            if value not in Schema.definitions:
-                Schema.definitions[value] = Object({k: Schema.make(v) for k, v in properties(value).items()}, **kwargs)
+        if not isinstance(value, type):
+            return Object({k: Schema.make(v) for k, v in properties(value).items()}, **kwargs)
+
+        registry = _registry.get()
 
-            return Schema.definitions[value]
+        with registry.lock:
+            if value in registry.references and not kwargs:
+                return registry.references[value]
+
+            if value in registry.pending:
+                registry.recursive.add(value)
+
+                return Reference("#/components/schemas/%s" % value.__name__)
+
+            if value not in registry.definitions:
+                registry.pending.add(value)
+
+                try:
+                    schema = Object({k: Schema.make(v) for k, v in properties(value).items()})
+                    registry.definitions[value] = registry.intern(schema)
+                finally:
+                    registry.pending.discard(value)
+
+            schema = registry.definitions[value]
+
+        if kwargs:
+            return Object(getattr(schema, 'properties', None), **kwargs)
+
+        return schema
 
 
 class Reference(Schema):
-    def __init__(self, value):
-        super().__init__(**{'$ref': value})
+    ref: str
 
-    def guard(self, fields: Dict[str, Any]):
-        return fields
+    _aliases = {'ref': '$ref'}
+
+    def __init__(self, value):
+        super().__init__(ref=value)
 
 
 class Boolean(Schema):
@@ -237,9 +564,135 @@ def _serialize(value) -> Any:
         return value.serialize()
 
     if isinstance(value, dict):
-        return {k: _serialize(v) for k, v in value.items() if v}
+        # dict.items, so lazy mappings of loaded documents hand out their unparsed values
+        return {k: _serialize(v) for k, v in dict.items(value) if v}
 
     if isinstance(value, list):
         return [_serialize(v) for v in value if v]
 
     return value
+
+
+def _freeze(value, parent: Definition = None) -> Any:
+    if isinstance(value, Definition):
+        if parent is not None:
+            value.adopt(parent)
+
+        return value
+
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v, parent)) for k, v in dict.items(value))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v, parent) for v in value)
+
+    if isinstance(value, set):
+        return frozenset(_freeze(v, parent) for v in value)
+
+    return value
+
+
+def _encode(value, parent: Definition = None, cache: bool = False) -> Iterator[bytes]:
+    if isinstance(value, Definition):
+        # only kept bytes have to be dropped when a child changes
+        if parent is not None and cache:
+            value.adopt(parent)
+
+        # kept bytes are joined as they are, views of loaded documents without a copy
+        fragment = getattr(value, '_fragment', None)
+
+        yield value.encode(cache) if fragment is None else fragment
+    elif isinstance(value, dict):
+        separator = b'{'
+
+        for k, v in dict.items(value):
+            if not v:
+                continue
+
+            yield separator
+            yield json_key(k).encode()
+            yield b': '
+            yield from _encode(v, parent, cache)
+
+            separator = b', '
+
+        yield b'{}' if separator == b'{' else b'}'
+    elif isinstance(value, list):
+        separator = b'['
+
+        for v in value:
+            if not v:
+                continue
+
+            yield separator
+            yield from _encode(v, parent, cache)
+
+            separator = b', '
+
+        yield b'[]' if separator == b'[' else b']'
+    else:
+        yield json.dumps(value).encode()
+
+
+def _make_list(value, **kwargs) -> Schema:
+    _items = Schema(nullable=True)
+
+    if hasattr(value, '__origin__'):
+        _items = Schema.make(value.__args__[0]) if getattr(value, '__args__', None) else _items
+    elif not isinstance(value, type):
+        if len(value) == 1:
+            _items = Schema.make(value[0])
+        elif len(value) > 1:
+            _items = _one_of([Schema.make(x) for x in value])
+
+    return Array(_items, **kwargs)
+
+
+def _one_of(schemas: List[Schema]) -> Schema:
+    try:
+        # equal elements give one alternative
+        schemas = list(dict.fromkeys(schemas))
+    except TypeError:  # unhashable default or example
+        pass
+
+    return schemas[0] if len(schemas) == 1 else Schema(oneOf=schemas)
+
+
+def _make_range(value, **kwargs) -> Schema:
+    args = {}
+
+    if not isinstance(value, type):
+        args = {
+            'minimum': min(value),
+            'maximum': max(value)
+        }
+
+    return Array(Integer(**args), **kwargs)
+
+
+def _make_dict(value, **kwargs) -> Schema:
+    _properties = None
+
+    if hasattr(value, '__origin__'):
+        if len(getattr(value, '__args__', None) or ()) == 2:
+            kwargs['additionalProperties'] = Schema.make(value.__args__[1])
+    elif not isinstance(value, type):
+        _properties = {k: Schema.make(v) for k, v in value.items()}
+
+    return Object(_properties, **kwargs)
+
+
+Schema.register(bool, Boolean)
+Schema.register(int, Integer)
+Schema.register(float, Float)
+Schema.register(complex, Float)  # TODO format?
+Schema.register(str, String)
+Schema.register(bytes, Byte)
+Schema.register(bytearray, Binary)
+Schema.register(object, Object)
+Schema.register(date, Date)
+Schema.register(time, Time)
+Schema.register(datetime, DateTime)
+Schema.register(list, _make_list)
+Schema.register(range, _make_range)
+Schema.register(dict, _make_dict)
@@ -0,0 +1,279 @@
+import json
+import re
+
+from typing import Any, Callable, Dict, List, Union
+from openapitools.definitions import OpenAPI, Components
+from openapitools.resolver import Resolver, UnresolvedReference
+from openapitools.types import NodeCache, Schema, Reference
+
+
+class ValidationError(ValueError):
+    def __init__(self, message: str, path: List[Union[str, int]] = None):
+        super().__init__(message)
+
+        self.message = message
+        self.path = path or []
+
+    def __str__(self):
+        if not self.path:
+            return self.message
+
+        return '%s: %s' % ('/'.join(str(x) for x in self.path), self.message)
+
+
+class Compiler:
+    resolver: Resolver
+
+    def __init__(self, spec: Union[OpenAPI, Components, Resolver] = None):
+        self.resolver = spec if isinstance(spec, Resolver) or spec is None else Resolver(spec)
+
+        self._cache = NodeCache()
+        self._refs = {}
+
+    def compile(self, schema: Schema) -> Callable[[Any], None]:
+        validator = self._cache.get(schema)
+
+        if validator is None:
+            validator = self._compile(schema)
+            self._cache.set(schema, validator)
+
+        return validator
+
+    def _compile(self, schema: Schema) -> Callable[[Any], None]:
+        if isinstance(schema, Reference):
+            return self._reference(schema.ref)
+
+        fields = {k: getattr(schema, k) for k in schema._names}
+        _type = fields.get('type')
+
+        # one closure per schema does the type check and every keyword of its type
+        if _type in ('integer', 'number'):
+            checks = [_number(_type, fields)]
+        elif _type == 'string':
+            checks = [_string(fields)]
+        elif _type == 'boolean':
+            checks = [_boolean]
+        elif _type == 'array':
+            checks = [self._array(fields)]
+        elif _type == 'object' or 'properties' in fields:
+            checks = [self._object(fields)]
+        else:
+            checks = []
+
+        if fields.get('allOf'):
+            checks.extend(self.compile(x) for x in fields['allOf'])
+
+        if fields.get('anyOf'):
+            checks.append(_any([self.compile(x) for x in fields['anyOf']]))
+
+        if fields.get('oneOf'):
+            checks.append(_one([self.compile(x) for x in fields['oneOf']]))
+
+        return _combine(checks, bool(fields.get('nullable')), _type is not None)
+
+    def _reference(self, pointer: str) -> Callable[[Any], None]:
+        if pointer in self._refs:
+            return self._refs[pointer]
+
+        if self.resolver is None:
+            raise UnresolvedReference(pointer)
+
+        # compiled on first use, so recursive schemas find their own pointer, and again after the target changes
+        target = self.resolver.resolve(pointer)
+        cell = [None, None]
+
+        def validate(value):
+            if cell[1] != target._version:
+                cell[0], cell[1] = self.compile(target), target._version
+
+            cell[0](value)
+
+        self._refs[pointer] = validate
+
+        return validate
+
+    def _array(self, fields: Dict[str, Any]) -> Callable[[Any], None]:
+        low, high = fields.get('minItems'), fields.get('maxItems')
+        item = self.compile(fields['items']) if fields.get('items') is not None else None
+        unique = bool(fields.get('uniqueItems'))
+
+        def validate(value):
+            if not isinstance(value, list):
+                raise ValidationError(_expected('array', value))
+
+            if low is not None or high is not None:
+                _bounds(len(value), low, high, 'items')
+
+            if item is not None:
+                for i, x in enumerate(value):
+                    try:
+                        item(x)
+                    except ValidationError as e:
+                        e.path.insert(0, i)
+                        raise
+
+            if unique and len({json.dumps(x, sort_keys=True) for x in value}) != len(value):
+                raise ValidationError('items are not unique')
+
+        return validate
+
+    def _object(self, fields: Dict[str, Any]) -> Callable[[Any], None]:
+        low, high = fields.get('minProperties'), fields.get('maxProperties')
+        properties = {k: self.compile(v) for k, v in (fields.get('properties') or {}).items()}
+        required = fields.get('required')
+
+        # a list on objects of loaded documents, a flag on each property schema otherwise
+        if not isinstance(required, list):
+            required = [k for k, v in (fields.get('properties') or {}).items() if getattr(v, 'required', False)]
+
+        additional = fields.get('additionalProperties')
+
+        if isinstance(additional, Schema):
+            additional = self.compile(additional)
+        elif additional is not False:
+            additional = None
+
+        lookup = properties.get
+        members = bool(properties) or additional is not None
+
+        def validate(value):
+            if not isinstance(value, dict):
+                raise ValidationError(_expected('object', value))
+
+            if low is not None or high is not None:
+                _bounds(len(value), low, high, 'properties')
+
+            for k in required:
+                if k not in value:
+                    raise ValidationError('%r is required' % k)
+
+            if members:
+                for k, v in value.items():
+                    check = lookup(k, additional)
+
+                    if check is None:
+                        continue
+
+                    if check is False:
+                        raise ValidationError('%r is not allowed' % k)
+
+                    try:
+                        check(v)
+                    except ValidationError as e:
+                        e.path.insert(0, k)
+                        raise
+
+        return validate
+
+
+_default = Compiler()
+
+
+def compile(schema: Schema) -> Callable[[Any], None]:
+    return _default.compile(schema)
+
+
+def _combine(checks: List[Callable[[Any], None]], nullable: bool, typed: bool) -> Callable[[Any], None]:
+    if len(checks) == 1 and not nullable:
+        return checks[0]
+
+    def validate(value):
+        if value is None and (nullable or typed):
+            if nullable:
+                return
+
+            raise ValidationError('null is not allowed')
+
+        for check in checks:
+            check(value)
+
+    return validate
+
+
+def _expected(name: str, value: Any) -> str:
+    return '%s expected, got %s' % (name, type(value).__name__)
+
+
+def _bounds(size: int, low: Any, high: Any, what: str):
+    if low is not None and size < low:
+        raise ValidationError('at least %s %s expected' % (low, what))
+
+    if high is not None and size > high:
+        raise ValidationError('at most %s %s expected' % (high, what))
+
+
+def _boolean(value):
+    if value.__class__ is not bool:
+        raise ValidationError(_expected('boolean', value))
+
+
+def _number(_type: str, fields: Dict[str, Any]) -> Callable[[Any], None]:
+    kinds = int if _type == 'integer' else (int, float)
+    low, high, step = fields.get('minimum'), fields.get('maximum'), fields.get('multipleOf')
+    above, below = bool(fields.get('exclusiveMinimum')), bool(fields.get('exclusiveMaximum'))
+
+    def validate(value):
+        if value.__class__ is bool or not isinstance(value, kinds):
+            raise ValidationError(_expected(_type, value))
+
+        if low is not None and (value < low or above and value == low):
+            raise ValidationError('%s %s expected' % ('greater than' if above else 'at least', low))
+
+        if high is not None and (value > high or below and value == high):
+            raise ValidationError('%s %s expected' % ('less than' if below else 'at most', high))
+
+        if step and value % step:
+            raise ValidationError('multiple of %s expected' % step)
+
+    return validate
+
+
+def _string(fields: Dict[str, Any]) -> Callable[[Any], None]:
+    low, high = fields.get('minLength'), fields.get('maxLength')
+    pattern = fields.get('pattern')
+    search = re.compile(pattern).search if pattern else None
+
+    def validate(value):
+        if not isinstance(value, str):
+            raise ValidationError(_expected('string', value))
+
+        if low is not None or high is not None:
+            _bounds(len(value), low, high, 'characters')
+
+        if search is not None and search(value) is None:
+            raise ValidationError('does not match %r' % pattern)
+
+    return validate
+
+
+def _any(options: List[Callable[[Any], None]]) -> Callable[[Any], None]:
+    def check(value):
+        for option in options:
+            try:
+                option(value)
+            except ValidationError:
+                continue
+
+            return
+
+        raise ValidationError('does not match any schema')
+
+    return check
+
+
+def _one(options: List[Callable[[Any], None]]) -> Callable[[Any], None]:
+    def check(value):
+        matched = 0
+
+        for option in options:
+            try:
+                option(value)
+            except ValidationError:
+                continue
+
+            matched += 1
+
+        if matched != 1:
+            raise ValidationError('matches %d schemas, exactly one expected' % matched)
+
+    return check
@@ -0,0 +1,86 @@
+import inspect
+import json
+
+from typing import Any, Iterator
+from openapitools.helpers import json_key
+from openapitools.types import Definition
+
+CHUNK_SIZE = 65536
+
+
+def iterencode(value: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    buffer = []
+    size = 0
+
+    for token in _tokens(value):
+        buffer.append(token)
+        size += len(token)
+
+        if size >= chunk_size:
+            yield ''.join(buffer)
+
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield ''.join(buffer)
+
+
+def dump(value: Any, fp, chunk_size: int = CHUNK_SIZE):
+    for chunk in iterencode(value, chunk_size):
+        fp.write(chunk)
+
+
+async def dump_async(value: Any, writer, chunk_size: int = CHUNK_SIZE, encoding: str = 'utf-8'):
+    drain = getattr(writer, 'drain', None)
+
+    for chunk in iterencode(value, chunk_size):
+        result = writer.write(chunk.encode(encoding))
+
+        if inspect.isawaitable(result):
+            await result
+        elif drain is not None:
+            await drain()
+
+
+def _tokens(value: Any) -> Iterator[str]:
+    if isinstance(value, Definition):
+        fragment = getattr(value, '_fragment', None)
+
+        if fragment is not None:
+            yield str(fragment, 'utf-8')
+            return
+
+        value = value.fields
+
+    if isinstance(value, dict):
+        separator = '{'
+
+        for k, v in dict.items(value):
+            if not v:
+                continue
+
+            yield separator
+            yield json_key(k)
+            yield ': '
+            yield from _tokens(v)
+
+            separator = ', '
+
+        yield '{}' if separator == '{' else '}'
+    elif isinstance(value, list):
+        separator = '['
+
+        for v in value:
+            if not v:
+                continue
+
+            yield separator
+            yield from _tokens(v)
+
+            separator = ', '
+
+        yield '[]' if separator == '[' else ']'
+    else:
+        yield json.dumps(value)
+
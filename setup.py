@@ -13,8 +13,14 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/zloyuser/openapi-tools',
     packages=setuptools.find_packages(),
+    python_requires='>=3.7',
     classifiers=(
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ),
@@ -0,0 +1,37 @@
+from openapitools import *
+
+
+class Todo:
+    id: int
+    text: str
+    done: bool
+
+
+def make_specification(title: str = 'TODO REST API', components: ComponentsBuilder = None) -> SpecificationBuilder:
+    builder = SpecificationBuilder(ComponentsBuilder() if components is None else components)
+    builder.describe(title, '1.0')
+    builder.license('MIT')
+    builder.contact('John Doe')
+
+    return builder
+
+
+def make_builder():
+    components = ComponentsBuilder()
+    components.scheme('Todo', Todo)
+
+    list_todo = OperationBuilder()
+    list_todo.parameter('limit', int)
+    list_todo.response(200, [Todo])
+
+    get_todo = OperationBuilder()
+    get_todo.parameter('id', int, 'path')
+    get_todo.response(200, Todo)
+
+    builder = make_specification(components=components)
+    operations = {'/todo/{id}': get_todo, '/todo': list_todo}
+
+    for path, operation in operations.items():
+        builder.operation(path, 'GET', operation)
+
+    return builder, components, operations
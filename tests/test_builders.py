@@ -0,0 +1,324 @@
+import asyncio
+import json
+import sys
+import threading
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import mock
+
+from openapitools import *
+from openapitools import types
+from openapitools.definitions import Response
+from openapitools.types import Object, Reference
+
+
+class TreeNode:
+    value: int
+    children: List['TreeNode']
+
+
+class Author:
+    name: str
+    books: List['Book']
+
+
+class Book:
+    title: str
+    author: Author
+
+
+class Todo:
+    id: int
+    text: str
+    done: False
+
+
+class ComponentsBuilderTestCase(unittest.TestCase):
+    def test_recursive(self):
+        components = ComponentsBuilder()
+        schema = Schema.make(TreeNode)
+
+        self.assertEqual(Reference('#/components/schemas/TreeNode'), schema.properties['children'].items)
+        self.assertIs(schema, components.build().fields['schemas']['TreeNode'])
+
+    def test_mutual(self):
+        components = ComponentsBuilder()
+        author = Schema.make(Author)
+        book = Schema.make(Book)
+
+        self.assertIs(book, author.properties['books'].items)
+        self.assertEqual(Reference('#/components/schemas/Author'), book.properties['author'])
+        self.assertEqual(['Author'], list(components.build().fields['schemas']))
+
+    def test_interned(self):
+        ComponentsBuilder(intern=True)
+
+        author = Schema.make(Author)
+        book = Schema.make(Book)
+
+        self.assertIs(author.properties['name'], book.properties['title'])
+        self.assertIs(Schema.make(int), Schema.make(int))
+        self.assertIs(Schema.make({'a': str}), Schema.make({'a': str}))
+
+        ComponentsBuilder()
+
+        self.assertIsNot(Schema.make(int), Schema.make(int))
+
+    def test_schemes(self):
+        components = ComponentsBuilder()
+        components.schemes([Book])
+        schemas = components.build().fields['schemas']
+
+        self.assertEqual(['Author', 'Book'], list(schemas))
+        self.assertEqual(Reference('#/components/schemas/Author'), schemas['Book'].properties['author'])
+        self.assertEqual(Reference('#/components/schemas/Book'), schemas['Author'].properties['books'].items)
+        self.assertEqual(Reference('#/components/schemas/Book'), Schema.make(Book))
+        self.assertEqual('Book', Schema.make(Book, description='Book').description)
+
+    def test_schemes_scheme(self):
+        components = ComponentsBuilder()
+        components.schemes([Book])
+        components.scheme('Book', Book)
+        components.scheme('Author', Author, description='Author')
+        schemas = components.build().fields['schemas']
+
+        self.assertEqual(['title', 'author'], list(schemas['Book'].properties))
+        self.assertEqual(Reference('#/components/schemas/Author'), schemas['Book'].properties['author'])
+        self.assertEqual('Author', schemas['Author'].description)
+
+        components = ComponentsBuilder()
+        components.scheme('Todo', Todo)
+        components.scheme('Todo', Todo)
+
+        self.assertEqual(['id', 'text', 'done'], list(components.build().fields['schemas']['Todo'].properties))
+
+    def test_schemes_module(self):
+        components = ComponentsBuilder()
+        components.schemes(sys.modules[__name__])
+        schemas = components.build().fields['schemas']
+
+        self.assertEqual({'TreeNode', 'Author', 'Book', 'Todo'}, set(schemas))
+        self.assertEqual(Reference('#/components/schemas/TreeNode'), schemas['TreeNode'].properties['children'].items)
+
+        class Todo:
+            title: str
+
+        with self.assertRaises(ValueError):
+            components.schemes([Todo])
+
+    def test_memoized(self):
+        ComponentsBuilder()
+
+        with mock.patch.object(types, 'properties', wraps=types.properties) as properties:
+            Schema.make(Book)
+            Schema.make(Book, description='Book')
+            Schema.make(List[Book])
+
+        self.assertEqual(2, properties.call_count)
+        self.assertIsInstance(Schema.make(Book, description='Book'), Object)
+
+    def test_scoped(self):
+        first = ComponentsBuilder()
+        second = ComponentsBuilder()
+
+        first.scheme('TreeNode', TreeNode)
+
+        self.assertIs(second.registry, types.Registry.current())
+        self.assertNotIn(TreeNode, second.registry.definitions)
+        self.assertIn('TreeNode', first.build().schemas)
+
+        with first.scope():
+            self.assertIs(first.build().schemas['TreeNode'], Schema.make(TreeNode))
+
+        self.assertIs(first.build().schemas['TreeNode'], Schema.make(TreeNode, registry=first.registry))
+        self.assertIsNot(first.build().schemas['TreeNode'], Schema.make(TreeNode))
+
+    def test_threads(self):
+        def build(i):
+            components = ComponentsBuilder()
+            barrier.wait()
+
+            for _ in range(50):
+                Schema.make(TreeNode)
+                Schema.make(Author)
+
+            return components.build(), types.Registry.current() is components.registry
+
+        barrier = threading.Barrier(4)
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(build, range(4)))
+
+        self.assertTrue(all(x for _, x in results))
+        self.assertEqual(4, len({id(x.schemas['TreeNode']) for x, _ in results}))
+
+    def test_bound_operations(self):
+        components = ComponentsBuilder()
+        builder = SpecificationBuilder(components)
+        builder.describe('Trees', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+
+        def register(path):
+            operation = OperationBuilder()
+            operation.response(200, TreeNode)
+            builder.operation(path, 'GET', operation)
+
+            return operation
+
+        thread = threading.Thread(target=register, args=('/a',))
+        thread.start()
+        thread.join()
+
+        # another builder is active now, operations registered after it are remade in their builder's registry
+        ComponentsBuilder()
+        operation = register('/b')
+        operation.response(201, Todo)
+
+        spec = json.loads(str(builder.build()))
+        reference = {'$ref': '#/components/schemas/TreeNode'}
+
+        self.assertEqual(['TreeNode'], list(spec['components']['schemas']))
+        self.assertEqual({'/a', '/b'}, set(spec['paths']))
+
+        for path in ('/a', '/b'):
+            schema = spec['paths'][path]['get']['responses']['200']['content']['*/*']['schema']
+            self.assertEqual(reference, schema['properties']['children']['items'])
+
+        self.assertIn(TreeNode, components.registry.recursive)
+        self.assertIn(Todo, components.registry.definitions)
+
+    def test_tasks(self):
+        async def build():
+            components = ComponentsBuilder()
+            await asyncio.sleep(0)
+            Schema.make(Book)
+
+            return components.build()
+
+        async def main():
+            return await asyncio.gather(build(), build())
+
+        first, second = asyncio.run(main())
+
+        self.assertEqual(['Book'], list(first.schemas))
+        self.assertIsNot(first.schemas['Book'], second.schemas['Book'])
+
+
+class SpecificationBuilderTestCase(unittest.TestCase):
+    def test_build(self):
+        components = ComponentsBuilder()
+        components.scheme(Todo.__name__, Schema.make(Todo))
+
+        builder = SpecificationBuilder(components)
+        builder.describe('TODO REST API', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+
+        get_todo = OperationBuilder()
+        get_todo.parameter('id', int, 'path')
+        get_todo.response(200, Todo)
+
+        builder.operation('/todo/{id}', 'GET', get_todo)
+
+        spec = json.loads(str(builder.build()))
+
+        self.assertEqual(['Todo'], list(spec['components']['schemas']))
+        self.assertEqual('path', spec['paths']['/todo/{id}']['get']['parameters'][0]['in'])
+
+    def test_incremental(self):
+        builder = SpecificationBuilder(ComponentsBuilder())
+        builder.describe('TODO REST API', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+
+        get_todo = OperationBuilder()
+        get_todo.response(200, Todo)
+        list_todo = OperationBuilder()
+        list_todo.response(200, [Todo])
+
+        builder.operation('/todo/{id}', 'GET', get_todo)
+        builder.operation('/todo', 'GET', list_todo)
+
+        first = builder.build()
+
+        get_todo.describe('Get todo by ID')
+
+        second = builder.build()
+
+        self.assertIs(first.paths['/todo'], second.paths['/todo'])
+        self.assertIsNot(first.paths['/todo/{id}'], second.paths['/todo/{id}'])
+        self.assertIs(first.components, second.components)
+        self.assertEqual('Get todo by ID', second.serialize()['paths']['/todo/{id}']['get']['summary'])
+
+        list_todo.tags.append('todo')
+        list_todo.responses[404] = Response.make(None, 'Not found')
+
+        third = builder.build()
+
+        self.assertIsNot(second.paths['/todo'], third.paths['/todo'])
+        self.assertIs(second.paths['/todo/{id}'], third.paths['/todo/{id}'])
+        self.assertEqual(['todo'], third.paths['/todo'].get.tags)
+        self.assertIn(404, third.paths['/todo'].get.responses)
+        self.assertIs(third.paths['/todo'], builder.build().paths['/todo'])
+
+    def test_deduplicate(self):
+        components = ComponentsBuilder()
+        components.scheme(Todo.__name__, Todo)
+
+        builder = SpecificationBuilder(components)
+        builder.describe('TODO REST API', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+
+        shape = [{'total': int, 'page': int, 'tags': [str]}]
+
+        for path in ('/a', '/b'):
+            operation = OperationBuilder()
+            operation.response(200, shape)
+            operation.response(201, Todo)
+            builder.operation(path, 'GET', operation)
+
+        spec = builder.build(deduplicate=True).serialize()
+        schemas = spec['components']['schemas']
+        name = [x for x in schemas if x != 'Todo'][0]
+
+        for path in ('/a', '/b'):
+            responses = spec['paths'][path]['get']['responses']
+
+            self.assertEqual({'$ref': '#/components/schemas/%s' % name}, responses[200]['content']['*/*']['schema'])
+            self.assertEqual({'$ref': '#/components/schemas/Todo'}, responses[201]['content']['*/*']['schema'])
+
+        self.assertEqual(['Todo', name], list(schemas))
+        self.assertEqual('array', schemas[name]['type'])
+        self.assertEqual(spec, builder.build(deduplicate=True).serialize())
+
+        inline = builder.build().serialize()['paths']['/a']['get']['responses'][200]['content']['*/*']['schema']
+
+        self.assertEqual('array', inline['type'])
+
+    def test_deduplicate_threshold(self):
+        components = ComponentsBuilder()
+        components.scheme('UserId', int)
+        components.scheme(Todo.__name__, Todo)
+
+        builder = SpecificationBuilder(components)
+        builder.describe('TODO REST API', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+
+        for path in ('/a', '/b'):
+            operation = OperationBuilder()
+            operation.parameter('limit', int)
+            operation.response(200, Todo)
+            builder.operation(path, 'GET', operation)
+
+        spec = builder.build(deduplicate=True).serialize()
+
+        self.assertEqual({'type': 'integer', 'format': 'int32'}, spec['paths']['/a']['get']['parameters'][0]['schema'])
+        self.assertEqual({'type': 'integer', 'format': 'int32'},
+                         spec['components']['schemas']['Todo']['properties']['id'])
+        self.assertEqual({'$ref': '#/components/schemas/Todo'},
+                         spec['paths']['/b']['get']['responses'][200]['content']['*/*']['schema'])
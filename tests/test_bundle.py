@@ -0,0 +1,78 @@
+import unittest
+
+from typing import Any
+
+from openapitools import *
+from openapitools.bundle import Bundle, bundle
+from openapitools.loader import load
+from openapitools.types import Reference, Object, String, Integer
+
+from tests.fixtures import make_specification
+
+
+class Tag:
+    name: str
+
+
+def make_spec(service: str, tag: Any = None, extra: dict = None):
+    components = ComponentsBuilder()
+    components.scheme('Tag', tag or Tag)
+    components.scheme('Todo', Object(properties={'tag': Reference('#/components/schemas/Tag'), **(extra or {})}))
+
+    builder = make_specification(service, components)
+
+    operation = OperationBuilder()
+    operation.tag(service)
+    operation.response(200, Reference('#/components/schemas/Todo'))
+    builder.operation('/%s/todo' % service, 'GET', operation)
+
+    return builder.build()
+
+
+class BundleTestCase(unittest.TestCase):
+    def test_bundle(self):
+        spec = bundle([make_spec('a'), make_spec('b'), make_spec('c', String())])
+        schemas = spec.components.schemas
+
+        self.assertEqual('a', spec.info.title)
+        self.assertEqual(['/a/todo', '/b/todo', '/c/todo'], list(spec.paths))
+        self.assertEqual(['a', 'b', 'c'], [x.name for x in spec.tags])
+        self.assertEqual(['Tag', 'Todo', 'Tag_2', 'Todo_2'], list(schemas))
+        self.assertEqual(Reference('#/components/schemas/Tag_2'), schemas['Todo_2'].properties['tag'])
+
+        for service, name in (('b', 'Todo'), ('c', 'Todo_2')):
+            response = spec.paths['/%s/todo' % service].get.responses[200].content['*/*'].schema
+            self.assertEqual(Reference('#/components/schemas/%s' % name), response)
+
+    def test_variants(self):
+        specs = [make_spec('a'), make_spec('b', extra={'id': Integer()}), make_spec('c', extra={'id': Integer()})]
+        schemas = bundle(iter(specs)).components.schemas
+
+        self.assertEqual(['Tag', 'Todo', 'Todo_2'], list(schemas))
+
+    def test_loaded(self):
+        specs = [load(make_spec(x, String() if x == 'c' else None).encode()) for x in 'abc']
+        spec = bundle(specs)
+
+        self.assertEqual(['Tag', 'Todo', 'Tag_2', 'Todo_2'], list(spec.components.schemas))
+        self.assertEqual(
+            {'$ref': '#/components/schemas/Todo_2'},
+            spec.serialize()['paths']['/c/todo']['get']['responses']['200']['content']['*/*']['schema'],
+        )
+
+    def test_conflict(self):
+        result = Bundle()
+        result.add(make_spec('a'))
+        result.add(make_spec('a'))
+
+        self.assertEqual(1, len(result.build().paths))
+
+        operation = OperationBuilder()
+        operation.describe('Changed')
+        builder = SpecificationBuilder(ComponentsBuilder())
+        builder.describe('a', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+        builder.operation('/a/todo', 'GET', operation)
+
+        self.assertRaises(ValueError, result.add, builder.build())
@@ -0,0 +1,129 @@
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from typing import List
+from openapitools.cache import BuildCache, fingerprint
+from openapitools.loader import LazyMapping
+
+from tests.fixtures import Todo, make_builder
+
+
+class Tag:
+    name: str
+
+
+class Post:
+    title: str
+    tags: List[Tag]
+
+
+class Note:
+    text: str
+
+    def words(self):
+        return [x for x in self.text.split() if x not in {'a', 'the'}]
+
+    @property
+    def title(self):
+        return self.text[:10]
+
+
+def make_notes():
+    return sorted(Note.__annotations__, key=lambda x: (x, {'text', 'id'}))
+
+
+class CacheTestCase(unittest.TestCase):
+    def test_fingerprint(self):
+        key = fingerprint(Post, make_builder)
+
+        self.assertEqual(key, fingerprint(Post, make_builder))
+        self.assertNotEqual(key, fingerprint(Todo, make_builder))
+        self.assertNotEqual(key, fingerprint(Post, make_builder, '/posts'))
+
+        Tag.__annotations__['color'] = str
+
+        try:
+            self.assertNotEqual(key, fingerprint(Post, make_builder))
+        finally:
+            del Tag.__annotations__['color']
+
+        self.assertEqual(key, fingerprint(Post, make_builder))
+        self.assertNotEqual(fingerprint(), fingerprint(sys.modules[__name__]))
+
+    def test_fingerprint_processes(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = 'from openapitools.cache import fingerprint\n' \
+                 'from tests.test_cache import Note, Post, make_notes\n' \
+                 'print(fingerprint(Note, Post, make_notes))'
+        keys = {
+            subprocess.run([sys.executable, '-c', script], cwd=root, env=dict(os.environ, PYTHONHASHSEED=seed),
+                           stdout=subprocess.PIPE, check=True).stdout.decode().strip()
+            for seed in ('1', '2')
+        }
+
+        self.assertEqual({fingerprint(Note, Post, make_notes)}, keys)
+
+    def test_load(self):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return make_builder()[0].build()
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BuildCache(directory)
+            built = cache.load(build, Todo, make_builder)
+            loaded = cache.load(build, Todo, make_builder)
+
+            self.assertEqual(1, len(builds))
+            self.assertIsInstance(loaded.paths, LazyMapping)
+            self.assertEqual(built.encode(), loaded.encode())
+            self.assertIsInstance(loaded.encode(), bytes)
+            self.assertIsInstance(loaded.view().obj, mmap.mmap)
+
+            loaded.info.title = 'Changed'
+
+            self.assertIn(b'"Changed"', loaded.encode())
+
+            cache.load(build, Todo, make_builder, 'v2')
+
+            self.assertEqual(2, len(builds))
+            self.assertEqual(1, len(os.listdir(directory)))
+
+    def test_shared_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first, second = BuildCache(directory), BuildCache(directory)
+
+            first.load(lambda: make_builder()[0].build(), Todo)
+            second.load(lambda: make_builder()[0].build(), Tag)
+            first.load(lambda: make_builder()[0].build(), Todo, 'v2')
+
+            # the file of the other cache is kept, the one replaced here is removed
+            self.assertEqual({first.path(fingerprint(Todo, 'v2')), second.path(fingerprint(Tag))},
+                             {os.path.join(directory, x) for x in os.listdir(directory)})
+
+    def test_address(self):
+        with self.assertRaises(TypeError):
+            fingerprint(object())
+
+        class Settings:
+            default = object()
+
+        with self.assertRaises(TypeError):
+            fingerprint(Settings)
+
+    def test_corrupt(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BuildCache(directory)
+            key = fingerprint(Todo)
+
+            with open(cache.path(key), 'wb'):
+                pass
+
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(make_builder()[0].build(), cache.load(lambda: make_builder()[0].build(), Todo))
+            self.assertIsNotNone(cache.get(key))
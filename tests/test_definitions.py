@@ -0,0 +1,128 @@
+import copy
+import pickle
+import unittest
+
+from openapitools.definitions import *
+from openapitools.types import *
+
+
+class DefinitionTestCase(unittest.TestCase):
+    def test_descriptors(self):
+        table = Integer.descriptors()
+
+        self.assertIn('type', table)
+        self.assertIn('minimum', table)
+        self.assertIs(table, Integer.descriptors())
+        self.assertNotIn('minimum', String.descriptors())
+
+    def test_guard(self):
+        self.assertEqual({'type': 'string'}, String(minimum=1).fields)
+
+    def test_aliases(self):
+        parameter = Parameter('id', Integer(), 'path', required=True)
+
+        self.assertEqual('in', parameter.descriptors()['location'].key)
+        self.assertEqual('path', parameter.serialize()['in'])
+        self.assertEqual(parameter.serialize(), parameter.serialize())
+        self.assertEqual('header', SecurityScheme('apiKey', location='header').fields['in'])
+
+    def test_slots(self):
+        schema = String(maxLength=10)
+
+        self.assertFalse(hasattr(schema, '__dict__'))
+        self.assertEqual(10, schema.maxLength)
+        self.assertFalse(hasattr(schema, 'pattern'))
+        self.assertEqual({'type': 'string', 'maxLength': 10}, schema.fields)
+        self.assertEqual(String(maxLength=10), schema)
+        self.assertEqual({'$ref': '#/components/schemas/Foo'}, Reference('#/components/schemas/Foo').serialize())
+
+    def test_serialize(self):
+        schema = String()
+        parent = Object({'name': schema})
+
+        self.assertIsNot(parent.serialize(), parent.serialize())
+
+        parent.serialize()['description'] = 'Changed'
+        schema.maxLength = 10
+
+        self.assertEqual({'type': 'object', 'properties': {'name': {'type': 'string', 'maxLength': 10}}},
+                         parent.serialize())
+
+        parent.properties['id'] = Integer()
+
+        self.assertEqual(['name', 'id'], list(parent.serialize()['properties']))
+
+    def test_copy(self):
+        parent = Object({'name': String()}, description='Person')
+        parent.encode()
+
+        shallow, deep = copy.copy(parent), copy.deepcopy(parent)
+
+        self.assertEqual(parent, shallow)
+        self.assertEqual(parent, deep)
+        self.assertIs(parent.properties, shallow.properties)
+        self.assertIsNot(parent.properties['name'], deep.properties['name'])
+
+        deep.properties['name'].maxLength = 10
+        shallow.description = 'Other'
+
+        self.assertNotIn(b'maxLength', parent.encode())
+        self.assertIn(b'"Person"', parent.encode())
+
+        node = Integer.__new__(Integer)
+        node.minimum = 1
+
+        self.assertEqual({'minimum': 1}, node.fields)
+
+    def test_pickle(self):
+        schema = String()
+        parent = Object({'name': schema}, description='Person')
+        parent.encode()
+        hash(parent)
+
+        clone = pickle.loads(pickle.dumps(parent))
+
+        self.assertEqual(parent, clone)
+        self.assertEqual(parent.encode(), clone.encode())
+
+        clone.properties['name'].maxLength = 10
+
+        self.assertIn(b'"maxLength": 10', clone.encode())
+        self.assertNotIn(b'maxLength', parent.encode())
+
+    def test_encode(self):
+        schema = String()
+        parent = Object({'name': schema}, description='Ünïcode')
+
+        self.assertEqual(str(parent).encode(), parent.encode())
+        self.assertIsNone(parent._fragment)
+
+        schema.maxLength = 10
+
+        self.assertEqual(str(parent).encode(), parent.encode())
+        self.assertIn(b'"maxLength": 10', parent.encode())
+
+    def test_encode_cache(self):
+        schema = String()
+        entry = Object({'name': schema})
+        components = Components(schemas={'Name': entry, 'Other': Object({'name': schema})})
+
+        self.assertEqual(str(components).encode(), components.encode(cache=True))
+        self.assertIs(entry.encode(), entry.encode())
+        self.assertIsNone(components._fragment)
+        self.assertIsNone(schema._fragment)
+
+        schema.maxLength = 10
+        components.schemas['Extra'] = String()
+
+        self.assertEqual(str(components).encode(), components.encode(cache=True))
+        self.assertIn(b'"maxLength": 10', entry.encode())
+        self.assertIn(b'"maxLength": 10', components.schemas['Other'].encode())
+
+    def test_hash(self):
+        a = Object({'id': Integer(), 'tags': [String()]})
+        b = Object({'id': Integer(), 'tags': [String()]})
+
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(1, len({a, b}))
+        self.assertNotEqual(hash(a), hash(Object({'id': Long()})))
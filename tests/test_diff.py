@@ -0,0 +1,95 @@
+import unittest
+
+from unittest import mock
+
+from openapitools import *
+from openapitools.diff import Change, diff, _mapping
+from openapitools.loader import load
+from openapitools.types import Integer, Object
+
+from tests.fixtures import Todo, make_builder
+
+
+class DiffTestCase(unittest.TestCase):
+    def test_identical(self):
+        builder, _, _ = make_builder()
+
+        self.assertEqual([], diff(builder.build(), builder.build()))
+        self.assertEqual([], diff(builder.build(), make_builder()[0].build()))
+
+    def test_changes(self):
+        builder, components, operations = make_builder()
+        old = builder.build()
+
+        operations['/todo'].parameter('offset', Integer(maximum=100))
+        operations['/todo/{id}'].describe('Get todo by ID')
+        builder.operation('/todo', 'POST', OperationBuilder())
+        components.scheme('Tag', str)
+
+        changes = {(x.kind, x.path) for x in diff(old, builder.build())}
+
+        self.assertEqual({
+            ('added', ('paths', '/todo', 'get', 'parameters', 'query:offset')),
+            ('added', ('paths', '/todo/{id}', 'get', 'summary')),
+            ('added', ('paths', '/todo', 'post')),
+            ('added', ('components', 'schemas', 'Tag')),
+        }, changes)
+
+    def test_schema_field(self):
+        old = make_builder()[0].build()
+        new = make_builder()[0].build()
+        new.components.schemas['Todo'].properties['id'] = Integer(minimum=1)
+
+        changes = diff(old, new)
+
+        # the component schema is also inlined into both responses
+        self.assertEqual(3, len(changes))
+        self.assertIn(Change('added', ('components', 'schemas', 'Todo', 'properties', 'id', 'minimum'), None, 1),
+                      changes)
+
+    def test_hash_collision(self):
+        old, new = Object(properties={'n': Integer(minimum=-1)}), Object(properties={'n': Integer(minimum=-2)})
+        self.assertEqual(hash(old), hash(new))
+
+        self.assertEqual([Change('changed', ('properties', 'n', 'minimum'), -1, -2)], diff(old, new))
+
+    def test_loaded(self):
+        builder, _, operations = make_builder()
+        old = load(builder.build().encode())
+
+        operations['/todo'].parameter('limit', str)
+        new = load(builder.build().encode())
+
+        self.assertEqual(
+            [Change('changed', ('paths', '/todo', 'get', 'parameters', 'query:limit', 'schema', 'type'),
+                    'integer', 'string'),
+             Change('removed', ('paths', '/todo', 'get', 'parameters', 'query:limit', 'schema', 'format'),
+                    'int32', None)],
+            diff(old, new),
+        )
+
+    def test_loaded_against_build(self):
+        builder, _, operations = make_builder()
+
+        for i in range(50):
+            operation = OperationBuilder()
+            operation.response(200, [Todo])
+            builder.operation('/todo/%d' % i, 'GET', operation)
+
+        old = load(builder.build().encode())
+
+        self.assertEqual([], diff(old, builder.build()))
+        self.assertEqual([], diff(builder.build(), old))
+
+        operations['/todo'].response(200, Integer())
+
+        self.assertEqual(
+            [('changed', ('paths', '/todo', 'get', 'responses', '200', 'content', '*/*', 'schema', 'type'))],
+            [(x.kind, x.path) for x in diff(old, builder.build())][:1],
+        )
+
+        with mock.patch('openapitools.diff._mapping', wraps=_mapping) as walked:
+            diff(old, builder.build())
+
+        # only the nodes on the way to the change are walked, not the other paths
+        self.assertLess(walked.call_count, 20)
@@ -0,0 +1,86 @@
+import json
+import unittest
+
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from openapitools import encoders
+from openapitools.encoders import encoder, dumps
+
+
+class Tag:
+    name: str
+    icon: bytes
+
+
+class Todo:
+    id: int
+    text: str
+    done = False
+    due: date
+    created: datetime
+    tags: List[Tag]
+    extra: Dict[str, Any]
+    children: List['Todo']
+
+    def __init__(self, _id: int, text: str, **kwargs):
+        self.id = _id
+        self.text = text
+        self.due = None
+        self.created = datetime(2020, 1, 2, 3, 4, 5)
+        self.tags = []
+        self.extra = {}
+        self.children = []
+        self.__dict__.update(kwargs)
+
+    def describe(self) -> str:
+        return self.text
+
+
+class Money:
+    def __init__(self, cents: int):
+        self.cents = cents
+
+
+class EncodersTestCase(unittest.TestCase):
+    def test_object(self):
+        tag = Tag()
+        tag.name = 'home'
+        tag.icon = b'\x00\x01'
+        todo = Todo(1, 'Buy milk', due=date(2020, 1, 3), tags=[tag], children=[Todo(2, 'Find a shop')])
+
+        self.assertEqual({
+            'id': 1,
+            'text': 'Buy milk',
+            'done': False,
+            'due': '2020-01-03',
+            'created': '2020-01-02T03:04:05',
+            'tags': [{'name': 'home', 'icon': 'AAE='}],
+            'extra': {},
+            'children': [{
+                'id': 2,
+                'text': 'Find a shop',
+                'done': False,
+                'due': None,
+                'created': '2020-01-02T03:04:05',
+                'tags': [],
+                'extra': {},
+                'children': [],
+            }],
+        }, json.loads(dumps(todo)))
+
+    def test_generic(self):
+        todo = Todo(1, 'Buy milk', extra={'at': date(2020, 1, 3), 'sizes': (1, 2)})
+
+        self.assertEqual({'at': '2020-01-03', 'sizes': [1, 2]}, json.loads(dumps(todo))['extra'])
+        self.assertEqual([1, 2], [x['id'] for x in json.loads(dumps([todo, Todo(2, 'Find a shop')], List[Todo]))])
+
+    def test_cache(self):
+        self.assertIs(encoder(Todo), encoder(Todo))
+        self.assertIs(encoder(List[Todo]), encoder(List[Todo]))
+
+    def test_register(self):
+        encoders.register(Money, lambda x: '%d.%02d' % divmod(x.cents, 100))
+
+        self.assertEqual('"12.05"', dumps(Money(1205)))
+        self.assertEqual('["0.99"]', dumps([Money(99)], List[Money]))
@@ -0,0 +1,109 @@
+import json
+import unittest
+
+from datetime import date
+from typing import List
+
+from openapitools import *
+from openapitools.extractors import Extractors, ParameterError, extractor
+from openapitools.loader import load
+from openapitools.resolver import UnresolvedReference
+from openapitools.types import Integer
+
+
+def make_operation():
+    operation = OperationBuilder()
+    operation.parameter('id', Integer(minimum=1), 'path')
+    operation.parameter('limit', Integer(maximum=100, default=20))
+    operation.parameter('done', bool)
+    operation.parameter('since', date)
+    operation.parameter('tag', List[str])
+    operation.parameter('X-Request-Id', str, 'header', required=True)
+    operation.parameter('ids', List[int], 'header')
+    operation.parameter('session', str, 'cookie')
+
+    return operation.build()
+
+
+class ExtractorsTestCase(unittest.TestCase):
+    def test_extract(self):
+        extract = extractor(make_operation())
+
+        self.assertEqual({
+            'id': 42,
+            'limit': 20,
+            'done': True,
+            'since': date(2020, 1, 2),
+            'tag': ['home', 'work'],
+            'X-Request-Id': 'abc',
+            'ids': [1, 2],
+            'session': 's3cr3t',
+        }, extract(
+            {'id': '42'},
+            'done=true&since=2020-01-02&tag=home&tag=work',
+            {'x-request-id': 'abc', 'IDS': '1,2'},
+            'theme=dark; session="s3cr3t"',
+        ))
+
+    def test_parsed(self):
+        extract = extractor(make_operation())
+        result = extract({'id': '1'}, {'limit': ['5'], 'tag': 'home'}, {'X-Request-Id': 'abc'}, {})
+
+        self.assertEqual({'id': 1, 'limit': 5, 'tag': ['home'], 'X-Request-Id': 'abc'}, result)
+
+    def test_errors(self):
+        extract = extractor(make_operation())
+        headers = {'X-Request-Id': 'abc'}
+
+        with self.assertRaises(ParameterError) as context:
+            extract({}, '', headers)
+
+        self.assertEqual(('id', 'path'), (context.exception.name, context.exception.location))
+        self.assertRaises(ParameterError, extract, {'id': '1'}, '')
+        self.assertRaises(ParameterError, extract, {'id': 'one'}, '', headers)
+        self.assertRaises(ParameterError, extract, {'id': '0'}, '', headers)
+        self.assertRaises(ParameterError, extract, {'id': '1'}, 'limit=500', headers)
+        self.assertRaises(ParameterError, extract, {'id': '1'}, 'done=maybe', headers)
+        self.assertRaises(ParameterError, extract, {'id': '1'}, 'since=yesterday', headers)
+
+    def test_cache(self):
+        operation = make_operation()
+
+        self.assertIs(extractor(operation), extractor(operation))
+
+        # equal structural hashes, hash(-1) == hash(-2), do not hide the change
+        operation.parameters[0].schema.minimum = -1
+        extractor(operation)
+        operation.parameters[0].schema.minimum = -2
+
+        self.assertEqual(-2, extractor(operation)({'id': '-2'}, '', {'X-Request-Id': 'abc'})['id'])
+
+    def test_loaded(self):
+        document = {
+            'openapi': '3.0.0',
+            'info': {'title': 'Pets', 'version': '1.0'},
+            'paths': {
+                '/pets/{id}': {
+                    'parameters': [{'$ref': '#/components/parameters/Id'}, {'name': 'limit', 'in': 'query'}],
+                    'get': {
+                        'parameters': [
+                            {'$ref': '#/components/parameters/Limit'},
+                            {'name': 'X-Trace', 'in': 'header', 'schema': {'type': 'string'}},
+                        ],
+                    },
+                },
+            },
+            'components': {
+                'parameters': {
+                    'Id': {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}},
+                    'Limit': {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer', 'maximum': 100}},
+                },
+            },
+        }
+        spec = load(json.dumps(document).encode())
+        item = spec.paths['/pets/{id}']
+        extract = Extractors(spec).compile(item.get, item)
+
+        self.assertEqual({'id': 7, 'limit': 5}, extract({'id': '7'}, 'limit=5'))
+        self.assertRaises(ParameterError, extract, {'id': '7'}, 'limit=500')
+        self.assertRaises(UnresolvedReference, extractor, item.get)
@@ -0,0 +1,59 @@
+import io
+import unittest
+
+from openapitools.inference import Inference, infer, lines
+from openapitools.types import Schema, Integer, Long, Float, String, Date, DateTime
+
+
+class InferenceTestCase(unittest.TestCase):
+    def test_widen(self):
+        self.assertEqual(Integer(), infer([1, 2]))
+        self.assertEqual(Long(), infer([1, 2 ** 40]))
+        self.assertEqual(Float(), infer([1, 2.5]))
+        self.assertEqual(Date(), infer(['2020-01-01', '2021-12-31']))
+        self.assertEqual(DateTime(), infer(['2020-01-01T10:00:00Z']))
+        self.assertEqual(String(), infer(['2020-01-01', 'tomorrow']))
+        self.assertEqual(Integer(nullable=True), infer([1, None]))
+        self.assertEqual(Schema(nullable=True), infer([None]))
+        self.assertEqual(Schema(oneOf=[Integer(), String()]), infer([1, 'a', 2, 'b']))
+
+    def test_objects(self):
+        schema = infer([
+            {'id': 1, 'name': 'a', 'tags': ['x']},
+            {'id': 2, 'name': None, 'tags': [], 'note': 'b'},
+        ]).serialize()
+
+        self.assertEqual({
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'format': 'int32', 'required': True},
+                'name': {'type': 'string', 'required': True, 'nullable': True},
+                'tags': {'type': 'array', 'items': {'type': 'string'}, 'required': True},
+                'note': {'type': 'string'},
+            },
+        }, schema)
+
+    def test_bounded(self):
+        inference = Inference(max_properties=10)
+        inference.update({'user%d' % i: {'score': i} for i in range(j, j + 5)} for j in range(0, 1000, 5))
+        schema = inference.schema().serialize()
+
+        self.assertEqual(200, inference.count)
+        self.assertNotIn('properties', schema)
+        self.assertEqual({'score': {'type': 'integer', 'format': 'int32', 'required': True}},
+                         schema['additionalProperties']['properties'])
+        self.assertEqual(1, len(inference._root.additional.properties))
+
+    def test_lines(self):
+        source = io.BytesIO(b'{"a": 1}\n\n{"a": 2.5, "b": true}\n')
+        schema = infer(lines(source)).serialize()
+
+        self.assertEqual({'a', 'b'}, set(schema['properties']))
+        self.assertEqual('number', schema['properties']['a']['type'])
+
+        with self.assertRaises(TypeError):
+            infer([object()])
+
+    def test_make_list(self):
+        self.assertEqual(Integer(), Schema.make([int, int]).items)
+        self.assertEqual(Schema(oneOf=[Integer(), String()]), Schema.make([int, str, int]).items)
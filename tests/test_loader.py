@@ -0,0 +1,156 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from openapitools import *
+from openapitools.definitions import OpenAPI, PathItem, Parameter
+from openapitools.loader import load, Raw
+from openapitools.types import Object, Long, Reference
+from openapitools.writers import iterencode
+
+from tests.fixtures import make_builder
+
+
+def make_spec():
+    return make_builder()[0].build(deduplicate=True)
+
+
+class LoaderTestCase(unittest.TestCase):
+    def test_roundtrip(self):
+        data = make_spec().encode()
+        spec = load(data)
+
+        self.assertIsInstance(spec, OpenAPI)
+        self.assertEqual(data, spec.encode())
+        self.assertEqual(json.loads(data), spec.serialize())
+        self.assertEqual(data.decode(), ''.join(iterencode(spec)))
+
+    def test_lazy(self):
+        spec = load(make_spec().encode())
+
+        self.assertIsInstance(dict.__getitem__(spec.paths, '/todo'), Raw)
+
+        item = spec.paths['/todo']
+
+        self.assertIsInstance(item, PathItem)
+        self.assertIs(item, dict.__getitem__(spec.paths, '/todo'))
+        self.assertIsInstance(item.get.parameters[0], Parameter)
+        self.assertEqual('query', item.get.parameters[0].location)
+        self.assertIsInstance(dict.__getitem__(spec.paths, '/todo/{id}'), Raw)
+        self.assertIsInstance(spec.components.schemas['Todo'], Object)
+        self.assertIsInstance(item.get.responses['200'].content['*/*'].schema.items, Reference)
+
+    def test_patch(self):
+        data = make_spec().encode()
+        spec = load(data)
+
+        spec.encode()
+        spec.paths['/todo'].get.summary = 'List todos'
+        spec.components.schemas['Todo'].properties['id'] = Long()
+        spec.components.schemas['Todo'].touch()
+
+        patched = json.loads(spec.encode())
+
+        self.assertEqual('List todos', patched['paths']['/todo']['get']['summary'])
+        self.assertEqual('int64', patched['components']['schemas']['Todo']['properties']['id']['format'])
+        self.assertEqual(json.loads(data)['paths']['/todo/{id}'], patched['paths']['/todo/{id}'])
+
+    def test_file(self):
+        data = make_spec().encode()
+
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as fp:
+            fp.write(data)
+
+        try:
+            self.assertEqual(data, load(fp.name).encode())
+        finally:
+            os.unlink(fp.name)
+
+    def test_unknown_keys(self):
+        document = {
+            'openapi': '3.0.0',
+            'info': {'title': 'Pets', 'version': '1.0', 'x-logo': 'logo.png'},
+            'x-tenant': {'id': 7},
+            'paths': {
+                '/pets/{id}': {
+                    'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+                    'get': {
+                        'responses': {
+                            '200': {
+                                'description': 'Pet',
+                                'headers': {'ETag': {'schema': {'type': 'string'}}},
+                                'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Pet'}}},
+                            },
+                        },
+                    },
+                },
+            },
+            'components': {
+                'schemas': {
+                    'Pet': {
+                        'type': 'object',
+                        'properties': {
+                            'kind': {'type': 'string', 'enum': ['cat', 'dog']},
+                            'id': {'type': 'integer', 'readOnly': True},
+                        },
+                    },
+                },
+                'x-internal': True,
+            },
+        }
+        spec = load(json.dumps(document).encode())
+
+        spec.paths['/pets/{id}'].get.summary = 'Get a pet'
+        spec.components.schemas['Pet'].description = 'A pet'
+
+        patched = json.loads(spec.encode())
+
+        self.assertEqual('Get a pet', patched['paths']['/pets/{id}']['get']['summary'])
+        self.assertEqual('A pet', patched['components']['schemas']['Pet']['description'])
+
+        for result in (patched, spec.serialize()):
+            del result['paths']['/pets/{id}']['get']['summary']
+            del result['components']['schemas']['Pet']['description']
+
+            self.assertEqual(document, result)
+
+    def test_strings(self):
+        document = {
+            'openapi': '3.0.0',
+            'info': {'title': 'Quotes "{[" and \\ slashes', 'version': '1.0'},
+            'paths': {'/a': {'summary': ']}"\\', 'get': {'description': '{"x": [1, 2]}'}}},
+        }
+        data = json.dumps(document).encode()
+        spec = load(data)
+
+        self.assertEqual(data, spec.encode())
+        self.assertEqual('{"x": [1, 2]}', spec.paths['/a'].get.description)
+
+        with self.assertRaises(ValueError):
+            load(data[:-3])
+
+    def test_mutate_paths(self):
+        spec = load(make_spec().encode())
+        spec.encode()
+
+        spec.paths['/new'] = PathItem(summary='New')
+
+        self.assertIn(b'"/new"', spec.encode())
+
+        del spec.paths['/new']
+
+        self.assertNotIn(b'"/new"', spec.encode())
+
+    def test_pickle(self):
+        data = make_spec().encode()
+        spec = pickle.loads(pickle.dumps(load(memoryview(data))))
+
+        self.assertEqual(data, spec.encode())
+        self.assertIsInstance(dict.__getitem__(spec.paths, '/todo'), Raw)
+        self.assertEqual('query', spec.paths['/todo'].get.parameters[0].location)
+
+        del spec.paths['/todo']
+
+        self.assertNotIn(b'"/todo"', spec.encode())
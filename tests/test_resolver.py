@@ -0,0 +1,101 @@
+import json
+import unittest
+
+from openapitools import *
+from openapitools.definitions import Components
+from openapitools.loader import load
+from openapitools.resolver import Resolver, UnresolvedReference, CircularReference
+from openapitools.types import Object, String, Reference
+
+from tests.test_builders import TreeNode, Author, Book
+
+
+class ResolverTestCase(unittest.TestCase):
+    def test_resolve(self):
+        components = ComponentsBuilder()
+        components.scheme('Book', Book)
+        resolver = Resolver(components.build())
+
+        self.assertIn('#/components/schemas/Book', resolver)
+        self.assertIs(components.build().schemas['Book'], resolver.resolve(Reference('#/components/schemas/Book')))
+        self.assertIs(resolver.resolve('#/components/schemas/Book'), resolver.get('#/components/schemas/Book'))
+
+    def test_transitive(self):
+        name = String()
+        resolver = Resolver(Components(schemas={
+            'A': Reference('#/components/schemas/B'),
+            'B': Reference('#/components/schemas/C'),
+            'C': name,
+            'a/b': Reference('#/components/schemas/A'),
+        }))
+
+        self.assertIs(name, resolver.resolve('#/components/schemas/a~1b'))
+        self.assertIs(name, resolver.resolve('#/components/schemas/B'))
+
+    def test_errors(self):
+        resolver = Resolver(Components(schemas={
+            'A': Reference('#/components/schemas/B'),
+            'B': Reference('#/components/schemas/A'),
+        }))
+
+        self.assertRaises(CircularReference, resolver.resolve, '#/components/schemas/A')
+        self.assertRaises(UnresolvedReference, resolver.resolve, '#/components/schemas/C')
+
+    def test_check(self):
+        components = ComponentsBuilder()
+        components.scheme('TreeNode', TreeNode)
+        components.scheme('Book', Book)
+        components.scheme('Author', Author)
+        components.scheme('Broken', Object(properties={'x': Reference('#/components/schemas/Missing')}))
+
+        unresolved, cycles = Resolver(components.build()).check()
+
+        self.assertEqual([('#/components/schemas/Broken/properties/x', '#/components/schemas/Missing')], unresolved)
+        self.assertEqual(
+            [['#/components/schemas/TreeNode'], ['#/components/schemas/Book']],
+            cycles,
+        )
+
+    def test_loaded(self):
+        components = ComponentsBuilder()
+        components.scheme('Book', Book)
+        builder = SpecificationBuilder(components)
+        builder.describe('Books', '1.0')
+        builder.license('MIT')
+        builder.contact('John Doe')
+        resolver = Resolver(load(builder.build().encode()))
+
+        self.assertIsInstance(resolver.resolve('#/components/schemas/Book'), Object)
+        self.assertEqual(1, len(resolver.check()[1]))
+
+    def test_loaded_references(self):
+        document = {
+            'openapi': '3.0.0',
+            'info': {'title': 'Pets', 'version': '1.0'},
+            'paths': {
+                '/pets': {
+                    'get': {
+                        'parameters': [{'$ref': '#/components/parameters/Missing'}],
+                        'responses': {'200': {'$ref': '#/components/responses/Ok'}},
+                    },
+                },
+            },
+            'components': {
+                'responses': {
+                    'Ok': {'description': 'Ok'},
+                    'R': {'$ref': '#/components/responses/Gone'},
+                    'S': {'$ref': '#/components/responses/S'},
+                },
+            },
+        }
+        resolver = Resolver(load(json.dumps(document).encode()))
+        unresolved, cycles = resolver.check()
+
+        self.assertEqual([
+            ('#/components/responses/R', '#/components/responses/Gone'),
+            ('#/paths/~1pets/get/parameters/0', '#/components/parameters/Missing'),
+        ], unresolved)
+        self.assertEqual([['#/components/responses/S']], cycles)
+        self.assertEqual('Ok', resolver.resolve('#/components/responses/Ok').description)
+        self.assertRaises(UnresolvedReference, resolver.resolve, '#/components/responses/R')
+        self.assertRaises(CircularReference, resolver.resolve, '#/components/responses/S')
@@ -0,0 +1,51 @@
+import unittest
+
+from openapitools import *
+from openapitools.router import Router
+
+from tests.fixtures import make_specification
+
+
+def make_spec():
+    builder = make_specification()
+
+    for path, method in (
+        ('/todo', 'GET'),
+        ('/todo', 'POST'),
+        ('/todo/{id}', 'GET'),
+        ('/todo/{id}', 'DELETE'),
+        ('/todo/latest', 'GET'),
+        ('/todo/{id}/tags/{tag}', 'GET'),
+        ('/files/{name}.{ext}', 'GET'),
+        ('/', 'GET'),
+    ):
+        builder.operation(path, method, OperationBuilder())
+
+    return builder.build()
+
+
+class RouterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.router = Router(make_spec())
+
+    def test_match(self):
+        operation, params = self.router.match('GET', '/todo/42/tags/home%20work')
+
+        self.assertEqual('/todo/{id}/tags/{tag}.get', operation.operationId)
+        self.assertEqual({'id': '42', 'tag': 'home work'}, params)
+        self.assertEqual('/todo.post', self.router.match('post', '/todo')[0].operationId)
+        self.assertEqual('/.get', self.router.match('GET', '/')[0].operationId)
+
+    def test_precedence(self):
+        self.assertEqual('/todo/latest.get', self.router.match('GET', '/todo/latest')[0].operationId)
+        self.assertEqual({'id': 'latest'}, self.router.match('DELETE', '/todo/latest')[1])
+
+    def test_template(self):
+        self.assertEqual({'name': 'report.2020', 'ext': 'pdf'}, self.router.match('GET', '/files/report.2020.pdf')[1])
+        self.assertIsNone(self.router.match('GET', '/files/report'))
+
+    def test_missing(self):
+        self.assertIsNone(self.router.match('GET', '/todo/42/tags'))
+        self.assertIsNone(self.router.match('GET', '/todo//tags/home'))
+        self.assertIsNone(self.router.match('PUT', '/todo/42'))
+        self.assertEqual(['get', 'delete'], self.router.methods('/todo/42'))
@@ -1,5 +1,8 @@
 import unittest
 
+from decimal import Decimal
+from enum import IntEnum
+from uuid import UUID
 from openapitools.types import *
 
 
@@ -12,6 +15,19 @@ class Bar:
     f: Foo
 
 
+class Color(IntEnum):
+    RED = 1
+
+
+class Name(str):
+    pass
+
+
+class Movie(dict):
+    title: str
+    year: int
+
+
 test_foo = Object(properties={'a': String()})
 test_bar = Object(properties={'i': Integer(), 'f': test_foo})
 
@@ -42,6 +58,10 @@ test_make_provider = [
     (dict, Object, {'type': 'object'}),
     (Bar, Object, test_bar.fields),
     (Bar(), Object, test_bar.fields),
+    (Color, Integer, {'type': 'integer', 'format': 'int32'}),
+    (Color.RED, Integer, {'type': 'integer', 'format': 'int32', 'default': Color.RED}),
+    (Name, String, {'type': 'string'}),
+    (Movie, Object, Object({'title': str, 'year': int}).fields),
 ]
 
 
@@ -52,3 +72,16 @@ class SchemaTestCase(unittest.TestCase):
 
             self.assertIsInstance(schema, v)
             self.assertEqual(fields, schema.fields)
+
+    def test_register(self):
+        Schema.register(Decimal, Double)
+        Schema.register(UUID, lambda value, **kwargs: String(format='uuid', **kwargs))
+
+        try:
+            self.assertEqual(Double(), Schema.make(Decimal))
+            self.assertEqual(String(format='uuid'), Schema.make(UUID))
+            self.assertIs(Schema.dispatch(UUID), Schema.dispatch(UUID))
+        finally:
+            Schema.handlers.pop(Decimal)
+            Schema.handlers.pop(UUID)
+            Schema._dispatch.clear()
@@ -0,0 +1,79 @@
+import asyncio
+import gzip
+import unittest
+
+from openapitools.serving import WSGIApp, ASGIApp, canonical, content_hash
+from openapitools.types import Integer, Object
+
+from tests.fixtures import make_builder
+
+
+class ServingTestCase(unittest.TestCase):
+    def test_content_hash(self):
+        a, b = make_builder()[0].build(), make_builder()[0].build()
+
+        self.assertIsNot(a, b)
+        self.assertEqual(content_hash(a), content_hash(b))
+        self.assertEqual(b'{"a":{"200":1,"300":2},"b":[true]}', canonical({'b': [True], 'a': {300: 2, 200: 1}}))
+
+        b.info.title = 'Changed'
+
+        self.assertNotEqual(content_hash(a), content_hash(b))
+
+    def test_content_hash_touch(self):
+        schema = Object(properties={'n': Integer(minimum=-1)})
+        digest = content_hash(schema)
+
+        # the structural hash does not change with it
+        schema.properties['n'].minimum = -2
+
+        self.assertNotEqual(digest, content_hash(schema))
+        self.assertEqual(content_hash(Object(properties={'n': Integer(minimum=-2)})), content_hash(schema))
+
+    def test_wsgi(self):
+        spec = make_builder()[0].build()
+        app = WSGIApp(spec)
+        started = []
+
+        start_response = lambda *args: started.append(args)  # noqa: E731
+
+        body = b''.join(app({'REQUEST_METHOD': 'GET', 'HTTP_ACCEPT_ENCODING': 'gzip, br'}, start_response))
+        status, headers = started[-1]
+        headers = dict(headers)
+
+        self.assertEqual('200 OK', status)
+        self.assertEqual('gzip', headers['Content-Encoding'])
+        self.assertEqual(spec.encode(), gzip.decompress(body))
+        self.assertEqual('"%s-gzip"' % content_hash(spec), headers['ETag'])
+
+        body = b''.join(app({'REQUEST_METHOD': 'GET', 'HTTP_IF_NONE_MATCH': headers['ETag']}, start_response))
+
+        self.assertEqual(('304 Not Modified', b''), (started[-1][0], body))
+
+        app({'REQUEST_METHOD': 'POST'}, start_response)
+
+        self.assertEqual('405 Method Not Allowed', started[-1][0])
+
+    def test_asgi(self):
+        spec = make_builder()[0].build()
+        app = ASGIApp(spec)
+
+        async def request(headers):
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            await app({'type': 'http', 'method': 'GET', 'headers': headers}, None, send)
+
+            return messages
+
+        start, body = asyncio.run(request([]))
+
+        self.assertEqual(200, start['status'])
+        self.assertEqual(spec.encode(), body['body'])
+
+        etag = dict(start['headers'])[b'etag']
+        start, body = asyncio.run(request([(b'If-None-Match', b'W/' + etag)]))
+
+        self.assertEqual((304, b''), (start['status'], body['body']))
@@ -0,0 +1,40 @@
+import unittest
+
+from openapitools import *
+from openapitools import stats
+from openapitools.types import Definition
+
+from tests.fixtures import make_builder
+
+
+class StatsTestCase(unittest.TestCase):
+    def setUp(self):
+        stats.stats.reset()
+
+    def test_instrumented(self):
+        timings = []
+
+        with stats.instrumented(lambda name, seconds: timings.append(name)) as result:
+            make_builder()[0].build().serialize()
+
+        self.assertEqual(2, result.calls['OperationBuilder.build'])
+        self.assertEqual(1, result.calls['SpecificationBuilder.build'])
+        self.assertGreater(result.calls['Schema.make'], 0)
+        self.assertGreater(result.calls['Definition.serialize'], 0)
+        self.assertEqual((2, 1), (result.hits, result.misses))
+        self.assertEqual(2, result.nodes['Operation'])
+        self.assertEqual(sum(result.calls.values()), len(timings))
+        self.assertIn('SpecificationBuilder.build', result.as_dict()['time'])
+
+    def test_disabled(self):
+        original = Definition.__dict__['serialize']
+
+        stats.enable()
+        self.assertIsNot(original, Definition.__dict__['serialize'])
+
+        stats.disable()
+        self.assertIs(original, Definition.__dict__['serialize'])
+
+        make_builder()[0].build()
+
+        self.assertEqual(0, sum(stats.stats.calls.values()))
@@ -0,0 +1,101 @@
+import unittest
+
+from typing import List
+
+from openapitools import *
+from openapitools.definitions import Components
+from openapitools.types import Integer, String, Array, Object, Reference
+from openapitools.validators import Compiler, ValidationError, compile
+
+from tests.test_builders import TreeNode
+
+
+class Todo:
+    id: int
+    text: str
+    tags: List[str]
+
+
+class ValidatorsTestCase(unittest.TestCase):
+    def test_scalars(self):
+        validate = compile(Integer(minimum=1, maximum=10, exclusiveMaximum=True))
+        validate(1)
+
+        self.assertRaises(ValidationError, validate, 0)
+        self.assertRaises(ValidationError, validate, 10)
+        self.assertRaises(ValidationError, validate, True)
+        self.assertRaises(ValidationError, validate, None)
+
+        validate = compile(String(pattern='^[a-z]+$', maxLength=3, nullable=True))
+        validate('abc')
+        validate(None)
+
+        self.assertRaises(ValidationError, validate, 'abcd')
+        self.assertRaises(ValidationError, validate, 'ab1')
+
+    def test_object(self):
+        validate = compile(Schema.make(Todo))
+        validate({'id': 1, 'text': 'Buy milk', 'tags': ['home']})
+
+        with self.assertRaises(ValidationError) as context:
+            validate({'id': 1, 'text': 'Buy milk', 'tags': ['home', 2]})
+
+        self.assertEqual(['tags', 1], context.exception.path)
+        self.assertEqual('tags/1: string expected, got int', str(context.exception))
+
+    def test_required(self):
+        validate = compile(Object(
+            properties={'id': Integer(required=True), 'text': String()},
+            additionalProperties=False,
+        ))
+        validate({'id': 1})
+
+        self.assertRaises(ValidationError, validate, {'text': 'Buy milk'})
+        self.assertRaises(ValidationError, validate, {'id': 1, 'done': True})
+
+    def test_combinators(self):
+        validate = compile(Schema(oneOf=[Integer(), Integer(minimum=0)]))
+        validate(-1)
+
+        self.assertRaises(ValidationError, validate, 1)
+        self.assertRaises(ValidationError, compile(Schema(anyOf=[Integer(), String()])), [])
+        self.assertRaises(ValidationError, compile(Schema(allOf=[Integer(), Integer(maximum=0)])), 1)
+
+    def test_references(self):
+        components = ComponentsBuilder()
+        components.scheme('TreeNode', TreeNode)
+        compiler = Compiler(components.build())
+        validate = compiler.compile(Reference('#/components/schemas/TreeNode'))
+        validate({'value': 1, 'children': [{'value': 2, 'children': []}]})
+
+        with self.assertRaises(ValidationError) as context:
+            validate({'value': 1, 'children': [{'value': '2'}]})
+
+        self.assertEqual(['children', 0, 'value'], context.exception.path)
+
+    def test_cache(self):
+        schema = Array(int, maxItems=2)
+        validate = compile(schema)
+
+        self.assertIs(validate, compile(schema))
+
+        schema.maxItems = 1
+
+        self.assertIsNot(validate, compile(schema))
+        self.assertRaises(ValidationError, compile(schema), [1, 2])
+
+        # equal structural hashes, hash(-1) == hash(-2), do not hide the change
+        schema = Object({'n': Integer(minimum=-1)})
+        compile(schema)
+        schema.properties['n'].minimum = -2
+        compile(schema)({'n': -2})
+
+    def test_cache_references(self):
+        item = Object({'id': Integer()})
+        compiler = Compiler(Components(schemas={'Item': item}))
+        validate = compiler.compile(Array(Reference('#/components/schemas/Item')))
+        validate([{'id': 1}])
+
+        item.properties['id'].minimum = 2
+
+        self.assertRaises(ValidationError, validate, [{'id': 1}])
@@ -0,0 +1,55 @@
+import asyncio
+import io
+import unittest
+
+from openapitools import *
+from openapitools.writers import iterencode, dump, dump_async
+
+from tests.fixtures import make_builder
+
+
+def make_spec():
+    builder, _, operations = make_builder()
+    operations['/todo/{id}'].describe('Get todo by ID', 'Ünïcode')
+    operations['/todo/{id}'].tag('todo')
+
+    return builder.build()
+
+
+class Writer:
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, chunk: bytes):
+        self.chunks.append(chunk)
+
+
+class WritersTestCase(unittest.TestCase):
+    def test_iterencode(self):
+        spec = make_spec()
+        chunks = list(iterencode(spec, chunk_size=64))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(str(spec), ''.join(chunks))
+
+    def test_dump(self):
+        spec = make_spec()
+        fp = io.StringIO()
+
+        dump(spec, fp)
+
+        self.assertEqual(str(spec), fp.getvalue())
+
+    def test_dump_async(self):
+        spec = make_spec()
+        writer = Writer()
+
+        asyncio.run(dump_async(spec, writer, chunk_size=64))
+
+        self.assertEqual(str(spec).encode(), b''.join(writer.chunks))
+
+    def test_keys(self):
+        self.assertEqual('{"200": 1, "null": 2}', ''.join(iterencode({200: 1, None: 2, 'x': []})))
+
+        with self.assertRaises(TypeError):
+            list(iterencode({(1, 2): 1}))